@@ -36,11 +36,13 @@ def list_events(
            👥 5 attendees
         ..."
     """
+    now = datetime.now()
+
     # Mock event data
     sample_events = [
         {
             "title": "Team Standup",
-            "date": datetime.now() + timedelta(days=1),
+            "date": now + timedelta(days=1),
             "time": "09:00",
             "duration": 30,
             "attendees": 5,
@@ -49,7 +51,7 @@ def list_events(
         },
         {
             "title": "Project Review with Stakeholders",
-            "date": datetime.now() + timedelta(days=1),
+            "date": now + timedelta(days=1),
             "time": "14:00",
             "duration": 60,
             "attendees": 8,
@@ -58,7 +60,7 @@ def list_events(
         },
         {
             "title": "Dentist Appointment",
-            "date": datetime.now() + timedelta(days=2),
+            "date": now + timedelta(days=2),
             "time": "10:30",
             "duration": 60,
             "attendees": 1,
@@ -67,7 +69,7 @@ def list_events(
         },
         {
             "title": "Coffee with Sarah",
-            "date": datetime.now() + timedelta(days=3),
+            "date": now + timedelta(days=3),
             "time": "15:00",
             "duration": 45,
             "attendees": 2,
@@ -76,7 +78,7 @@ def list_events(
         },
         {
             "title": "Quarterly Planning Meeting",
-            "date": datetime.now() + timedelta(days=5),
+            "date": now + timedelta(days=5),
             "time": "10:00",
             "duration": 120,
             "attendees": 12,
@@ -86,7 +88,7 @@ def list_events(
     ]
 
     # Filter by days ahead
-    cutoff_date = datetime.now() + timedelta(days=days_ahead)
+    cutoff_date = now + timedelta(days=days_ahead)
     filtered_events = [e for e in sample_events if e["date"] <= cutoff_date]
 
     # Filter by calendar
@@ -112,14 +114,16 @@ def list_events(
         events_by_date[date_key].append(event)
 
     # Format events
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
     for date_key in sorted(events_by_date.keys()):
         events = events_by_date[date_key]
         event_date = events[0]["date"]
 
         # Date header
-        if event_date.date() == datetime.now().date():
+        if event_date.date() == today:
             day_label = "Today"
-        elif event_date.date() == (datetime.now() + timedelta(days=1)).date():
+        elif event_date.date() == tomorrow:
             day_label = "Tomorrow"
         else:
             day_label = event_date.strftime("%A")
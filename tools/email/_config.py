@@ -0,0 +1,19 @@
+"""Shared configuration for email tools.
+
+Resolves once, at import time, whether email tools should talk to the real
+Gmail API or fall back to mock data.
+"""
+
+import os
+
+# Try to import Gmail utilities
+try:
+    from .gmail_utils import get_gmail_client, is_gmail_configured
+    GMAIL_AVAILABLE = True
+except ImportError:
+    GMAIL_AVAILABLE = False
+    get_gmail_client = lambda: None
+    is_gmail_configured = lambda: False
+
+# Check if we should use real Gmail or mock
+USE_REAL_GMAIL = os.getenv("USE_REAL_EMAIL_API", "false").lower() == "true" and GMAIL_AVAILABLE
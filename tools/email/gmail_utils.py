@@ -18,6 +18,7 @@ Setup:
 import os
 import base64
 import pickle
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional, List, Dict
@@ -44,6 +45,28 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.modify',
 ]
 
+# Gmail search operators for each supported search scope
+SEARCH_OPERATORS = {
+    'subject': 'subject:({query})',
+    'from': 'from:({query})',
+    'body': '{query}',
+    'all': '{query}',
+}
+
+
+def build_search_query(query: str, search_in: str = 'all') -> str:
+    """Translate a search scope into a native Gmail ``q=`` query.
+
+    Args:
+        query: Search terms
+        search_in: Where to search ('all', 'subject', 'body', 'from')
+
+    Returns:
+        Gmail search query string
+    """
+    template = SEARCH_OPERATORS.get(search_in, SEARCH_OPERATORS['all'])
+    return template.format(query=query)
+
 
 class GmailClient:
     """Gmail API client for email operations."""
@@ -97,6 +120,7 @@ class GmailClient:
             with open(self.token_file, 'wb') as token:
                 pickle.dump(creds, token)
 
+        self._credentials = creds
         self._service = build('gmail', 'v1', credentials=creds)
 
     @property
@@ -104,6 +128,11 @@ class GmailClient:
         """Get authenticated Gmail service."""
         return self._service
 
+    @property
+    def credentials(self):
+        """Get the OAuth2 credentials backing the service."""
+        return self._credentials
+
     def send_email(
         self,
         to: str,
@@ -233,15 +262,8 @@ class GmailClient:
             List of matching email dictionaries
         """
         try:
-            # Build Gmail query
-            if search_in == 'subject':
-                gmail_query = f'subject:{query}'
-            elif search_in == 'from':
-                gmail_query = f'from:{query}'
-            elif search_in == 'body':
-                gmail_query = query
-            else:
-                gmail_query = query
+            # Build Gmail query so filtering happens server-side
+            gmail_query = build_search_query(query, search_in)
 
             # Search messages
             results = self.service.users().messages().list(
@@ -554,18 +576,35 @@ class GmailClient:
             raise Exception(f"Failed to get inbox stats: {error}")
 
 
+# Per-thread GmailClient cache; the underlying httplib2 transport is not
+# thread-safe, and tools may run concurrently in parallel workflows
+_thread_clients = threading.local()
+
+
 def get_gmail_client() -> Optional[GmailClient]:
     """Get authenticated Gmail client.
 
+    Each thread authenticates once and reuses its client across tool calls
+    until the client's access token expires; the client is then rebuilt from
+    the token file, which refreshes the token.
+
     Returns:
         GmailClient instance or None if credentials not configured
     """
+    client = getattr(_thread_clients, "client", None)
+    if client is not None and client.credentials.valid:
+        return client
+
+    _thread_clients.client = None
     try:
-        return GmailClient()
+        client = GmailClient()
     except (FileNotFoundError, ImportError) as e:
         print(f"Gmail not configured: {e}")
         return None
 
+    _thread_clients.client = client
+    return client
+
 
 def is_gmail_configured() -> bool:
     """Check if Gmail is properly configured.
@@ -2,19 +2,63 @@
 
 from typing import Annotated
 from datetime import datetime
-import os
+import random
 from tools._decorators import tool
+from ._config import USE_REAL_GMAIL, get_gmail_client, is_gmail_configured
 
-# Try to import Gmail utilities
-try:
-    from .gmail_utils import get_gmail_client, is_gmail_configured
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-    is_gmail_configured = lambda: False
 
-# Check if we should use real Gmail or mock
-USE_REAL_GMAIL = os.getenv("USE_REAL_EMAIL_API", "false").lower() == "true" and GMAIL_AVAILABLE
+def _tag_emoji(tag: str, rules: tuple, default: str = "🏷️") -> str:
+    """Pick the emoji of the first rule with a keyword found in a tag.
+
+    Args:
+        tag: Tag text
+        rules: Ordered (emoji, keywords) pairs; earlier rules take precedence
+        default: Emoji to use when no rule matches
+
+    Returns:
+        Emoji for the tag
+    """
+    tag_lower = tag.lower()
+    for emoji, keywords in rules:
+        for keyword in keywords:
+            if keyword in tag_lower:
+                return emoji
+    return default
+
+
+# Priority level -> indicator emoji
+_PRIORITY_EMOJIS = {
+    "low": "🟢",
+    "normal": "🟡",
+    "high": "🟠",
+    "urgent": "🔴",
+}
+
+# Category -> indicator emoji
+_CATEGORY_EMOJIS = {
+    "work": "💼",
+    "personal": "👤",
+    "finance": "💰",
+    "travel": "✈️",
+    "shopping": "🛒",
+    "health": "🏥",
+    "family": "👨‍👩‍👧‍👦",
+}
+
+# Tag emoji rules for tag_email, in precedence order
+_TAG_EMOJI_RULES = (
+    ("🔴", ("urgent", "important")),
+    ("💬", ("needs-response", "reply")),
+    ("🔄", ("follow-up",)),
+    ("⏳", ("waiting",)),
+)
+
+# Tag emoji rules for create_email_filter auto-tags, in precedence order
+_FILTER_TAG_EMOJI_RULES = (
+    ("🔴", ("urgent",)),
+    ("💬", ("needs-response",)),
+    ("⭐", ("important",)),
+)
 
 
 @tool(
@@ -131,40 +175,15 @@ def _tag_email_real(
     if tag_list:
         result += f"\n\n🏷️  **Tags Applied ({len(tag_list)}):**"
         for tag in tag_list:
-            # Add emoji based on tag type
-            if "urgent" in tag.lower() or "important" in tag.lower():
-                emoji = "🔴"
-            elif "needs-response" in tag.lower() or "reply" in tag.lower():
-                emoji = "💬"
-            elif "follow-up" in tag.lower():
-                emoji = "🔄"
-            elif "waiting" in tag.lower():
-                emoji = "⏳"
-            else:
-                emoji = "🏷️"
+            emoji = _tag_emoji(tag, _TAG_EMOJI_RULES)
             result += f"\n   {emoji} {tag}"
 
     if priority and priority.lower() != "normal":
-        priority_emojis = {
-            "low": "🟢",
-            "normal": "🟡",
-            "high": "🟠",
-            "urgent": "🔴"
-        }
-        emoji = priority_emojis.get(priority.lower(), "⚪")
+        emoji = _PRIORITY_EMOJIS.get(priority.lower(), "⚪")
         result += f"\n\n⚡ **Priority:** {emoji} {priority.title()}"
 
     if category:
-        category_emojis = {
-            "work": "💼",
-            "personal": "👤",
-            "finance": "💰",
-            "travel": "✈️",
-            "shopping": "🛒",
-            "health": "🏥",
-            "family": "👨‍👩‍👧‍👦"
-        }
-        emoji = category_emojis.get(category.lower(), "📁")
+        emoji = _CATEGORY_EMOJIS.get(category.lower(), "📁")
         result += f"\n\n📁 **Category:** {emoji} {category.title()}"
 
     result += f"\n\n⏰ **Tagged at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -205,41 +224,15 @@ def _tag_email_mock(
     if tag_list:
         result += f"\n🏷️  **Tags Applied ({len(tag_list)}):**"
         for tag in tag_list:
-            # Add emoji based on tag type
-            if "urgent" in tag.lower() or "important" in tag.lower():
-                emoji = "🔴"
-            elif "needs-response" in tag.lower() or "reply" in tag.lower():
-                emoji = "💬"
-            elif "follow-up" in tag.lower():
-                emoji = "🔄"
-            elif "waiting" in tag.lower():
-                emoji = "⏳"
-            else:
-                emoji = "🏷️"
-
+            emoji = _tag_emoji(tag, _TAG_EMOJI_RULES)
             result += f"\n   {emoji} {tag}"
 
     if priority:
-        priority_emojis = {
-            "low": "🟢",
-            "normal": "🟡",
-            "high": "🟠",
-            "urgent": "🔴"
-        }
-        emoji = priority_emojis.get(priority.lower(), "⚪")
+        emoji = _PRIORITY_EMOJIS.get(priority.lower(), "⚪")
         result += f"\n⚡ **Priority:** {emoji} {priority.title()}"
 
     if category:
-        category_emojis = {
-            "work": "💼",
-            "personal": "👤",
-            "finance": "💰",
-            "travel": "✈️",
-            "shopping": "🛒",
-            "health": "🏥",
-            "family": "👨‍👩‍👧‍👦"
-        }
-        emoji = category_emojis.get(category.lower(), "📁")
+        emoji = _CATEGORY_EMOJIS.get(category.lower(), "📁")
         result += f"\n📁 **Category:** {emoji} {category.title()}"
 
     result += f"\n\n⏰ **Tagged at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -365,13 +358,7 @@ def _bulk_tag_emails_real(
             result += f"\n   • {tag}"
 
     if priority:
-        priority_emojis = {
-            "low": "🟢",
-            "normal": "🟡",
-            "high": "🟠",
-            "urgent": "🔴"
-        }
-        emoji = priority_emojis.get(priority.lower(), "⚪")
+        emoji = _PRIORITY_EMOJIS.get(priority.lower(), "⚪")
         result += f"\n\n⚡ **Priority Set:** {emoji} {priority.title()}"
 
     result += f"\n\n⏰ **Completed at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -387,7 +374,6 @@ def _bulk_tag_emails_mock(
     limit: int = 10
 ) -> str:
     """Mock implementation of bulk email tagging."""
-    import random
     num_emails = random.randint(1, min(limit, 15))
 
     tag_list = [t.strip() for t in tags.split(",")] if tags else []
@@ -407,13 +393,7 @@ def _bulk_tag_emails_mock(
             result += f"\n   • {tag}"
 
     if priority:
-        priority_emojis = {
-            "low": "🟢",
-            "normal": "🟡",
-            "high": "🟠",
-            "urgent": "🔴"
-        }
-        emoji = priority_emojis.get(priority.lower(), "⚪")
+        emoji = _PRIORITY_EMOJIS.get(priority.lower(), "⚪")
         result += f"\n\n⚡ **Priority Set:** {emoji} {priority.title()}"
 
     result += f"\n\n⏰ **Completed at:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -552,14 +532,7 @@ def _create_email_filter_real(
         tag_list = [t.strip() for t in auto_tag.split(",")]
         result += f"\n\n🏷️  **Auto-Tags ({len(tag_list)}):**"
         for tag in tag_list:
-            if "urgent" in tag.lower():
-                emoji = "🔴"
-            elif "needs-response" in tag.lower():
-                emoji = "💬"
-            elif "important" in tag.lower():
-                emoji = "⭐"
-            else:
-                emoji = "🏷️"
+            emoji = _tag_emoji(tag, _FILTER_TAG_EMOJI_RULES)
             result += f"\n   {emoji} {tag}"
 
     result += f"\n\n📊 **Filter Status:** Active"
@@ -607,15 +580,7 @@ def _create_email_filter_mock(
         tag_list = [t.strip() for t in auto_tag.split(",")]
         result += f"\n\n🏷️  **Auto-Tags ({len(tag_list)}):**"
         for tag in tag_list:
-            # Tag-specific emojis
-            if "urgent" in tag.lower():
-                emoji = "🔴"
-            elif "needs-response" in tag.lower():
-                emoji = "💬"
-            elif "important" in tag.lower():
-                emoji = "⭐"
-            else:
-                emoji = "🏷️"
+            emoji = _tag_emoji(tag, _FILTER_TAG_EMOJI_RULES)
             result += f"\n   {emoji} {tag}"
 
     result += f"\n\n📊 **Filter Status:** Active"
@@ -716,8 +681,6 @@ def _get_inbox_summary_real(include_stats: bool = True) -> str:
 
 def _get_inbox_summary_mock(include_stats: bool = True) -> str:
     """Mock implementation of inbox summary."""
-    import random
-
     total = random.randint(30, 100)
     urgent = random.randint(2, 8)
     needs_response = random.randint(5, 20)
@@ -3,19 +3,32 @@
 from typing import Annotated
 from datetime import datetime, timedelta
 import random
-import os
 from tools._decorators import tool
+from ._config import USE_REAL_GMAIL, get_gmail_client, is_gmail_configured
 
-# Try to import Gmail utilities
-try:
-    from .gmail_utils import get_gmail_client, is_gmail_configured
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-    is_gmail_configured = lambda: False
+# Noun for the message count, indexed by ``count == 1``
+_MESSAGE_NOUNS = ("messages", "message")
 
-# Check if we should use real Gmail or mock
-USE_REAL_GMAIL = os.getenv("USE_REAL_EMAIL_API", "false").lower() == "true" and GMAIL_AVAILABLE
+# Read-status indicator, indexed by the unread flag
+_STATUS_ICONS = ("⚪", "🟢")
+
+# Priority indicator shown after the sender in mock rows
+_PRIORITY_ICONS = {
+    "high": "🔴",
+    "normal": "🟡",
+}
+
+# Inbox row for Gmail messages; fields map onto the parsed message dict
+_GMAIL_ROW_FORMAT = """{i}. {status} **From:** {from}
+   📝 **Subject:** {subject}
+   💬 **Preview:** {preview}
+   ⏰ **Received:** {received}"""
+
+# Inbox row for mock messages
+_MOCK_ROW_FORMAT = """{i}. {status} **From:** {from} {priority_icon}
+   📝 **Subject:** {subject}
+   💬 **Preview:** {preview}
+   ⏰ **Received:** {timestamp}"""
 
 
 @tool(
@@ -62,19 +75,11 @@ def read_inbox(
                 return "📭 **No emails found** matching your criteria."
 
             header = "📬 **Unread Messages** (via Gmail)" if filter_unread else "📬 **Your Inbox** (via Gmail)"
-            result = [f"{header} ({len(emails)} {'message' if len(emails) == 1 else 'messages'})\n"]
-
-            for i, email in enumerate(emails, 1):
-                status = "🟢" if email['unread'] else "⚪"
-
-                result.append(f"""
-{i}. {status} **From:** {email['from']}
-   📝 **Subject:** {email['subject']}
-   💬 **Preview:** {email['preview']}
-   ⏰ **Received:** {email['received']}
-                """.strip())
-
-            return "\n\n".join(result)
+            rows = [
+                _GMAIL_ROW_FORMAT.format(i=i, status=_STATUS_ICONS[email["unread"]], **email)
+                for i, email in enumerate(emails, 1)
+            ]
+            return "\n\n".join([f"{header} ({len(emails)} {_MESSAGE_NOUNS[len(emails) == 1]})\n", *rows])
 
         except Exception as e:
             # Fall back to mock if Gmail fails
@@ -147,22 +152,20 @@ def _read_inbox_mock(limit: int = 5, filter_unread: bool = False) -> str:
     if not emails:
         return "📭 **No emails found** matching your criteria."
 
-    result = [f"{header} ({len(emails)} {'message' if len(emails) == 1 else 'messages'})\n"]
-
+    now = datetime.now()
+    rows = []
     for i, email in enumerate(emails, 1):
         # Generate realistic timestamp
         hours_ago = random.randint(1, 48)
-        timestamp = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M")
+        timestamp = (now - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M")
 
-        # Status indicator
-        status = "🟢" if email["unread"] else "⚪"
-        priority_icon = "🔴" if email["priority"] == "high" else "🟡" if email["priority"] == "normal" else ""
+        rows.append(_MOCK_ROW_FORMAT.format(
+            i=i,
+            status=_STATUS_ICONS[email["unread"]],
+            priority_icon=_PRIORITY_ICONS.get(email["priority"], ""),
+            timestamp=timestamp,
+            **email,
+        ))
 
-        result.append(f"""
-{i}. {status} **From:** {email['from']} {priority_icon}
-   📝 **Subject:** {email['subject']}
-   💬 **Preview:** {email['preview']}
-   ⏰ **Received:** {timestamp}
-        """.strip())
+    return "\n\n".join([f"{header} ({len(emails)} {_MESSAGE_NOUNS[len(emails) == 1]})\n", *rows])
 
-    return "\n\n".join(result)
@@ -1,21 +1,105 @@
 """Search emails tool - Find emails by query."""
 
 from typing import Annotated
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 import random
-import os
+import re
 from tools._decorators import tool
+from ._config import USE_REAL_GMAIL, get_gmail_client, is_gmail_configured
+
+# Timestamp format for received dates in mock results
+RECEIVED_FORMAT = "%Y-%m-%d %H:%M"
+
+
+@dataclass(slots=True, frozen=True)
+class _Email:
+    """Mock email record returned by the offline search."""
+
+    sender: str
+    subject: str
+    preview: str
+    match_score: float
+
+
+# Mock search results keyed by topic keyword
+_SEARCH_CORPUS = {
+    "project": [
+        _Email(
+            sender="boss@company.com",
+            subject="Project Update Required",
+            preview="Hi, can you provide an update on the Q4 project status...",
+            match_score=0.95,
+        ),
+        _Email(
+            sender="pm@company.com",
+            subject="New Project Assignment",
+            preview="You've been assigned to the new mobile app project...",
+            match_score=0.90,
+        ),
+    ],
+    "meeting": [
+        _Email(
+            sender="client@bigcorp.com",
+            subject="Meeting Confirmation - Tomorrow 2PM",
+            preview="Looking forward to our meeting tomorrow to discuss...",
+            match_score=0.98,
+        ),
+    ],
+    "review": [
+        _Email(
+            sender="notifications@github.com",
+            subject="Pull Request Review Requested",
+            preview="johndoe requested your review on PR #142...",
+            match_score=0.92,
+        ),
+    ],
+}
+
+# C-level sort key for ranking results by relevance
+_BY_SCORE = attrgetter("match_score")
+
+# Noun for the result count, indexed by ``count == 1``
+_EMAIL_NOUNS = ("emails", "email")
+
+# Rendered search scope for each supported search_in value
+_SCOPE_LABELS = {
+    "all": "everywhere",
+    "subject": "in subject",
+    "from": "in from",
+    "body": "in body",
+}
+
+# Search header per search_in value, with the scope phrase already inlined
+_HEADER_FORMATS = {
+    search_in: f"🔍 **Search Results for '{{query}}' {scope}**"
+    for search_in, scope in _SCOPE_LABELS.items()
+}
+
+# Field prefixes shared by every result row
+_FROM_LABEL = "📧 **From:**"
+_SUBJECT_LABEL = "📝 **Subject:**"
+_PREVIEW_LABEL = "💬 **Preview:**"
+_RECEIVED_LABEL = "⏰ **Received:**"
+_RELEVANCE_LABEL = "🎯 **Relevance:**"
+
+# Result row for Gmail search hits; fields map onto the parsed message dict
+_GMAIL_ROW_FORMAT = (
+    f"{{i}}. {_FROM_LABEL} {{from}}\n"
+    f"   {_SUBJECT_LABEL} {{highlighted_subject}}\n"
+    f"   {_PREVIEW_LABEL} {{preview}}\n"
+    f"   {_RECEIVED_LABEL} {{received}}"
+)
 
-# Try to import Gmail utilities
-try:
-    from .gmail_utils import get_gmail_client, is_gmail_configured
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-    is_gmail_configured = lambda: False
-
-# Check if we should use real Gmail or mock
-USE_REAL_GMAIL = os.getenv("USE_REAL_EMAIL_API", "false").lower() == "true" and GMAIL_AVAILABLE
+# Result row for mock search hits
+_MOCK_ROW_FORMAT = (
+    f"{{i}}. {_FROM_LABEL} {{sender}}\n"
+    f"   {_SUBJECT_LABEL} {{highlighted_subject}}\n"
+    f"   {_PREVIEW_LABEL} {{preview}}\n"
+    f"   {_RECEIVED_LABEL} {{timestamp}}\n"
+    f"   {_RELEVANCE_LABEL} {{relevance}}%"
+)
 
 
 @tool(
@@ -56,30 +140,23 @@ def search_emails(
             gmail = get_gmail_client()
             emails = gmail.search_emails(query=query, search_in=search_in, limit=20)
 
-            search_scope = f"in {search_in}" if search_in != "all" else "everywhere"
-            header = f"🔍 **Search Results for '{query}' {search_scope}** (via Gmail)\n"
+            header = _search_header(query, search_in) + " (via Gmail)\n"
 
             if not emails:
                 return header + "\n❌ No emails found matching your query."
 
-            result_text = [header, f"\nFound {len(emails)} matching {'email' if len(emails) == 1 else 'emails'}:\n"]
+            # Highlight query in subject, whatever its casing
+            query_pattern = re.compile(re.escape(query), re.IGNORECASE)
+            rows = []
 
             for i, email in enumerate(emails, 1):
-                # Highlight query in subject
-                highlighted_subject = email["subject"]
-                if query.lower() in email["subject"].lower():
-                    highlighted_subject = email["subject"].replace(
-                        query, f"**{query}**"
-                    )
-
-                result_text.append(f"""
-{i}. 📧 **From:** {email['from']}
-   📝 **Subject:** {highlighted_subject}
-   💬 **Preview:** {email['preview']}
-   ⏰ **Received:** {email['received']}
-                """.strip())
-
-            return "\n\n".join(result_text)
+                rows.append(_GMAIL_ROW_FORMAT.format(
+                    i=i,
+                    highlighted_subject=query_pattern.sub(r"**\g<0>**", email["subject"]),
+                    **email,
+                ))
+
+            return _render_results(header, rows)
 
         except Exception as e:
             # Fall back to mock if Gmail fails
@@ -99,88 +176,80 @@ def _search_emails_mock(query: str, search_in: str = "all") -> str:
     Returns:
         Formatted mock search results
     """
-    # Mock search results based on query
-    search_results = {
-        "project": [
-            {
-                "from": "boss@company.com",
-                "subject": "Project Update Required",
-                "preview": "Hi, can you provide an update on the Q4 project status...",
-                "match_score": 0.95
-            },
-            {
-                "from": "pm@company.com",
-                "subject": "New Project Assignment",
-                "preview": "You've been assigned to the new mobile app project...",
-                "match_score": 0.90
-            },
-        ],
-        "meeting": [
-            {
-                "from": "client@bigcorp.com",
-                "subject": "Meeting Confirmation - Tomorrow 2PM",
-                "preview": "Looking forward to our meeting tomorrow to discuss...",
-                "match_score": 0.98
-            },
-        ],
-        "review": [
-            {
-                "from": "notifications@github.com",
-                "subject": "Pull Request Review Requested",
-                "preview": "johndoe requested your review on PR #142...",
-                "match_score": 0.92
-            },
-        ],
-    }
-
     # Find matching results (case-insensitive)
     query_lower = query.lower()
     results = []
 
-    for keyword, emails in search_results.items():
+    for keyword, emails in _SEARCH_CORPUS.items():
         if query_lower in keyword or keyword in query_lower:
             results.extend(emails)
 
     # If no specific matches, return generic results
-    if not results:
+    matched = bool(results)
+    if not matched:
         results = [
-            {
-                "from": "notifications@system.com",
-                "subject": f"Results for '{query}'",
-                "preview": "No exact matches found, showing related results...",
-                "match_score": 0.5
-            }
+            _Email(
+                sender="notifications@system.com",
+                subject=f"Results for '{query}'",
+                preview="No exact matches found, showing related results...",
+                match_score=0.5,
+            )
         ]
 
     # Sort by match score
-    results.sort(key=lambda x: x["match_score"], reverse=True)
+    results.sort(key=_BY_SCORE, reverse=True)
 
     # Build response
-    search_scope = f"in {search_in}" if search_in != "all" else "everywhere"
-    header = f"🔍 **Search Results for '{query}' {search_scope}**\n"
+    header = _search_header(query, search_in) + "\n"
 
     if not results:
         return header + "\n❌ No emails found matching your query."
 
-    result_text = [header, f"\nFound {len(results)} matching {'email' if len(results) == 1 else 'emails'}:\n"]
+    # Highlight query in matched subjects, whatever its casing; the generic
+    # fallback subject quotes the query verbatim and is left as-is
+    query_pattern = re.compile(re.escape(query), re.IGNORECASE)
+    rows = []
 
+    now = datetime.now()
     for i, email in enumerate(results, 1):
         # Generate realistic timestamp
         hours_ago = random.randint(1, 72)
-        timestamp = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M")
-
-        # Highlight query in subject (mock)
-        highlighted_subject = email["subject"].replace(
-            query.title(),
-            f"**{query.title()}**"
-        )
-
-        result_text.append(f"""
-{i}. 📧 **From:** {email['from']}
-   📝 **Subject:** {highlighted_subject}
-   💬 **Preview:** {email['preview']}
-   ⏰ **Received:** {timestamp}
-   🎯 **Relevance:** {int(email['match_score'] * 100)}%
-        """.strip())
-
-    return "\n\n".join(result_text)
+        timestamp = (now - timedelta(hours=hours_ago)).strftime(RECEIVED_FORMAT)
+
+        rows.append(_MOCK_ROW_FORMAT.format(
+            i=i,
+            sender=email.sender,
+            highlighted_subject=(
+                query_pattern.sub(r"**\g<0>**", email.subject) if matched else email.subject
+            ),
+            preview=email.preview,
+            timestamp=timestamp,
+            relevance=int(email.match_score * 100),
+        ))
+
+    return _render_results(header, rows)
+
+
+def _render_results(header: str, rows: list[str]) -> str:
+    """Assemble the search response in a single join.
+
+    Shared by the Gmail and mock branches so the final buffer is built once,
+    however many rows the search returns.
+
+    Args:
+        header: Rendered search header
+        rows: Rendered result rows
+
+    Returns:
+        Complete formatted search response
+    """
+    count_line = f"\nFound {len(rows)} matching {_EMAIL_NOUNS[len(rows) == 1]}:\n"
+    return "\n\n".join([header, count_line, *rows])
+
+
+def _search_header(query: str, search_in: str) -> str:
+    """Render the search header from the template specialized for search_in."""
+    template = _HEADER_FORMATS.get(search_in)
+    if template is None:
+        return f"🔍 **Search Results for '{query}' in {search_in}**"
+    return template.format(query=query)
@@ -2,20 +2,12 @@
 
 from typing import Annotated
 from datetime import datetime
+import zlib
 from tools._decorators import tool
-import os
+from ._config import USE_REAL_GMAIL, get_gmail_client, is_gmail_configured
 
-# Try to import Gmail utilities
-try:
-    from .gmail_utils import get_gmail_client, is_gmail_configured
-    GMAIL_AVAILABLE = True
-except ImportError:
-    GMAIL_AVAILABLE = False
-    is_gmail_configured = lambda: False
-
-
-# Check if we should use real Gmail or mock
-USE_REAL_GMAIL = os.getenv("USE_REAL_EMAIL_API", "false").lower() == "true" and GMAIL_AVAILABLE
+# Timestamp format for sent-message confirmations
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 @tool(
@@ -62,7 +54,7 @@ def send_email(
 
 📧 **To:** {to}
 📝 **Subject:** {subject}
-💬 **Message:** {body[:100]}{'...' if len(body) > 100 else ''}
+💬 **Message:** {_preview(body)}
 ⏰ **Sent:** {result_data['timestamp']}
 🔢 **Message ID:** {result_data['message_id']}
                 """.strip()
@@ -82,6 +74,13 @@ def send_email(
     return _send_email_mock(to, subject, body, cc)
 
 
+def _preview(body: str, length: int = 100) -> str:
+    """Truncate a message body for display, reusing short bodies as-is."""
+    if len(body) <= length:
+        return body
+    return body[:length] + "..."
+
+
 def _send_email_mock(to: str, subject: str, body: str, cc: str = "") -> str:
     """Mock implementation of email sending.
 
@@ -94,20 +93,21 @@ def _send_email_mock(to: str, subject: str, body: str, cc: str = "") -> str:
     Returns:
         Formatted mock confirmation message
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
 
     result = f"""
 ✅ **Email Sent Successfully!** (MOCK)
 
 📧 **To:** {to}
 📝 **Subject:** {subject}
-💬 **Message:** {body[:100]}{'...' if len(body) > 100 else ''}
+💬 **Message:** {_preview(body)}
 ⏰ **Sent:** {timestamp}
     """.strip()
 
     if cc:
         result += f"\n📎 **CC:** {cc}"
 
-    result += f"\n🔢 **Message ID:** MSG-{hash(f'{to}{subject}{timestamp}') % 100000}"
+    message_id = zlib.crc32(f"{to}\0{subject}\0{timestamp}".encode()) % 100000
+    result += f"\n🔢 **Message ID:** MSG-{message_id}"
 
     return result
@@ -0,0 +1,28 @@
+"""Shared date parsing for HR tools."""
+
+from datetime import datetime
+import re
+
+# YYYY-MM-DD with optional zero-padding on month and day, as strptime accepts
+_DATE_PATTERN = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+
+def parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date into a midnight datetime.
+
+    Matches ``datetime.strptime(value, "%Y-%m-%d")`` on ASCII input: month
+    and day may be unpadded, and no time or offset suffix is allowed.
+
+    Args:
+        value: Date string to parse
+
+    Returns:
+        Datetime at midnight on the given day
+
+    Raises:
+        ValueError: If value is not a valid YYYY-MM-DD date
+    """
+    match = _DATE_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid date: {value!r}")
+    return datetime(*map(int, match.groups()))
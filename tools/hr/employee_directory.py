@@ -2,8 +2,195 @@
 
 from typing import Annotated
 from datetime import datetime
+from itertools import islice
+import re
 from tools._decorators import tool
 
+# Mock employee directory
+_EMPLOYEES = (
+    {
+        "id": "EMP001",
+        "name": "John Doe",
+        "email": "john.doe@company.com",
+        "department": "Engineering",
+        "role": "Senior Software Engineer",
+        "manager": "Jane Smith",
+        "location": "San Francisco, CA",
+        "start_date": "2020-03-15"
+    },
+    {
+        "id": "EMP002",
+        "name": "Jane Smith",
+        "email": "jane.smith@company.com",
+        "department": "Engineering",
+        "role": "Engineering Manager",
+        "manager": "Bob Johnson",
+        "location": "San Francisco, CA",
+        "start_date": "2018-01-10"
+    },
+    {
+        "id": "EMP003",
+        "name": "Alice Johnson",
+        "email": "alice.j@company.com",
+        "department": "Human Resources",
+        "role": "HR Manager",
+        "manager": "Bob Johnson",
+        "location": "New York, NY",
+        "start_date": "2019-06-01"
+    },
+    {
+        "id": "EMP004",
+        "name": "Bob Johnson",
+        "email": "bob.johnson@company.com",
+        "department": "Executive",
+        "role": "Chief Technology Officer",
+        "manager": "CEO",
+        "location": "San Francisco, CA",
+        "start_date": "2017-11-20"
+    },
+    {
+        "id": "EMP005",
+        "name": "Carol White",
+        "email": "carol.white@company.com",
+        "department": "Marketing",
+        "role": "Marketing Specialist",
+        "manager": "David Brown",
+        "location": "Austin, TX",
+        "start_date": "2021-08-15"
+    },
+)
+
+# Full profile returned by get_employee_details, extending the directory entry
+_EMPLOYEE_PROFILE = {
+    **_EMPLOYEES[0],
+    "phone": "+1 (555) 123-4567",
+    "level": "L5",
+    "manager": "Jane Smith (EMP002)",
+    "office": "HQ - Floor 3, Desk 42",
+    "employment_type": "Full-time",
+    "team": "Backend Platform",
+    "skills": ("Python", "Go", "Kubernetes", "AWS"),
+    "projects": ("Payment System v2", "API Gateway"),
+    "next_review": "2025-12-15",
+    "vacation_days": 15,
+    "sick_days": 5,
+}
+
+# Lowercased (name, department, role) per employee, parallel to _EMPLOYEES
+_EMPLOYEES_LOWER = tuple(
+    (emp["name"].lower(), emp["department"].lower(), emp["role"].lower())
+    for emp in _EMPLOYEES
+)
+
+# Columns of _EMPLOYEES_LOWER checked for each search_by value
+_SEARCH_COLUMNS = {
+    "name": (0,),
+    "department": (1,),
+    "role": (2,),
+    "all": (0, 1, 2),
+}
+
+
+def _render_profile(emp: dict) -> str:
+    """Render an employee profile, minus the per-call timestamp.
+
+    Args:
+        emp: Employee profile record
+
+    Returns:
+        Formatted profile text
+    """
+    return f"""
+👤 **Employee Profile**
+
+**Basic Information:**
+   • Name: {emp['name']}
+   • Employee ID: {emp['id']}
+   • Email: {emp['email']}
+   • Phone: {emp['phone']}
+
+**Position:**
+   • Role: {emp['role']}
+   • Level: {emp['level']}
+   • Department: {emp['department']}
+   • Team: {emp['team']}
+   • Manager: {emp['manager']}
+
+**Employment Details:**
+   • Type: {emp['employment_type']}
+   • Start Date: {emp['start_date']}
+   • Next Review: {emp['next_review']}
+
+**Location:**
+   • Office: {emp['location']}
+   • Workspace: {emp['office']}
+
+**Skills:**
+   {', '.join(emp['skills'])}
+
+**Current Projects:**
+   • {chr(10).join(f"  • {p}" for p in emp['projects'])}
+
+**Time Off Balance:**
+   • Vacation Days: {emp['vacation_days']} remaining
+   • Sick Days: {emp['sick_days']} remaining
+    """.strip()
+
+
+# Rendered once at import; get_employee_details only appends the timestamp
+_EMPLOYEE_PROFILE_TEXT = _render_profile(_EMPLOYEE_PROFILE)
+
+# Static org charts served by get_org_chart
+_ENGINEERING_ORG_CHART = """
+🏢 **Engineering Department - Organization Chart**
+
+**Bob Johnson** - Chief Technology Officer
+├── **Jane Smith** - Engineering Manager
+│   ├── John Doe - Senior Software Engineer
+│   ├── Mike Chen - Software Engineer
+│   └── Sarah Lee - Junior Software Engineer
+└── **Alex Kumar** - Engineering Manager
+    ├── Tom Wilson - Senior DevOps Engineer
+    └── Lisa Park - DevOps Engineer
+""".strip()
+
+_HR_ORG_CHART = """
+🏢 **Human Resources Department - Organization Chart**
+
+**Alice Johnson** - HR Manager
+├── Mary Thompson - HR Specialist
+├── David Kim - Recruiter
+└── Emily Davis - HR Coordinator
+""".strip()
+
+_COMPANY_ORG_CHART = """
+🏢 **Company Organization Chart**
+
+**CEO** - Sarah Williams
+├── **CTO** - Bob Johnson (Technology)
+│   ├── Engineering Manager - Jane Smith
+│   └── Engineering Manager - Alex Kumar
+├── **CFO** - Michael Brown (Finance)
+│   ├── Senior Accountant - James Wilson
+│   └── Financial Analyst - Emma Davis
+├── **HR Manager** - Alice Johnson (Human Resources)
+│   ├── HR Specialist - Mary Thompson
+│   └── Recruiter - David Kim
+└── **CMO** - Rachel Green (Marketing)
+    ├── Marketing Manager - Carol White
+    └── Social Media Manager - Kevin Lee
+""".strip()
+
+# Department charts keyed by the whole words that select them, in precedence
+# order; whole words keep "hr" from matching inside names like "Three Rivers"
+_ORG_CHARTS = (
+    (frozenset({"engineering"}), _ENGINEERING_ORG_CHART),
+    (frozenset({"hr", "human"}), _HR_ORG_CHART),
+)
+
+# Splits a department name into lowercase words
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
 
 @tool(
     domain="hr",
@@ -32,89 +219,29 @@ def search_employees(
         1. John Doe - Senior Engineer
         2. Jane Smith - Engineering Manager..."
     """
-    # Mock employee data
-    mock_employees = [
-        {
-            "id": "EMP001",
-            "name": "John Doe",
-            "email": "john.doe@company.com",
-            "department": "Engineering",
-            "role": "Senior Software Engineer",
-            "manager": "Jane Smith",
-            "location": "San Francisco, CA",
-            "start_date": "2020-03-15"
-        },
-        {
-            "id": "EMP002",
-            "name": "Jane Smith",
-            "email": "jane.smith@company.com",
-            "department": "Engineering",
-            "role": "Engineering Manager",
-            "manager": "Bob Johnson",
-            "location": "San Francisco, CA",
-            "start_date": "2018-01-10"
-        },
-        {
-            "id": "EMP003",
-            "name": "Alice Johnson",
-            "email": "alice.j@company.com",
-            "department": "Human Resources",
-            "role": "HR Manager",
-            "manager": "Bob Johnson",
-            "location": "New York, NY",
-            "start_date": "2019-06-01"
-        },
-        {
-            "id": "EMP004",
-            "name": "Bob Johnson",
-            "email": "bob.johnson@company.com",
-            "department": "Executive",
-            "role": "Chief Technology Officer",
-            "manager": "CEO",
-            "location": "San Francisco, CA",
-            "start_date": "2017-11-20"
-        },
-        {
-            "id": "EMP005",
-            "name": "Carol White",
-            "email": "carol.white@company.com",
-            "department": "Marketing",
-            "role": "Marketing Specialist",
-            "manager": "David Brown",
-            "location": "Austin, TX",
-            "start_date": "2021-08-15"
-        },
-    ]
-
     # Filter based on search criteria
     query_lower = query.lower()
-    results = []
-
-    for emp in mock_employees:
-        if search_by == "all":
-            if (query_lower in emp["name"].lower() or
-                query_lower in emp["department"].lower() or
-                query_lower in emp["role"].lower()):
-                results.append(emp)
-        elif search_by == "name" and query_lower in emp["name"].lower():
-            results.append(emp)
-        elif search_by == "department" and query_lower in emp["department"].lower():
-            results.append(emp)
-        elif search_by == "role" and query_lower in emp["role"].lower():
-            results.append(emp)
-
-    # Limit results
-    results = results[:limit]
+    columns = _SEARCH_COLUMNS.get(search_by, ())
+    matches = (
+        emp
+        for emp, fields in zip(_EMPLOYEES, _EMPLOYEES_LOWER)
+        if any(query_lower in fields[column] for column in columns)
+    )
+
+    # Limit results, stopping the scan as soon as enough are found
+    results = list(islice(matches, max(limit, 0)))
 
     if not results:
         return f"❌ No employees found matching '{query}' in {search_by}"
 
     # Format output
-    result = f"🔍 **Employee Search Results** ({len(results)} found)\n\n"
-    result += f"**Query:** '{query}' in {search_by}\n\n"
+    parts = [
+        f"🔍 **Employee Search Results** ({len(results)} found)",
+        f"**Query:** '{query}' in {search_by}",
+    ]
 
     for i, emp in enumerate(results, 1):
-        result += f"""
+        parts.append(f"""
 {i}. 👤 **{emp['name']}** ({emp['id']})
    📧 {emp['email']}
    💼 {emp['role']}
@@ -122,9 +249,9 @@ def search_employees(
    👔 Reports to: {emp['manager']}
    📍 {emp['location']}
    📅 Start Date: {emp['start_date']}
-        """.strip() + "\n\n"
+        """.strip())
 
-    return result.strip()
+    return "\n\n".join(parts)
 
 
 @tool(
@@ -154,67 +281,7 @@ def get_employee_details(
     if not employee_id and not email:
         return "❌ **Error:** Please provide either employee_id or email"
 
-    # Mock employee database
-    mock_employee = {
-        "id": "EMP001",
-        "name": "John Doe",
-        "email": "john.doe@company.com",
-        "phone": "+1 (555) 123-4567",
-        "department": "Engineering",
-        "role": "Senior Software Engineer",
-        "level": "L5",
-        "manager": "Jane Smith (EMP002)",
-        "location": "San Francisco, CA",
-        "office": "HQ - Floor 3, Desk 42",
-        "start_date": "2020-03-15",
-        "employment_type": "Full-time",
-        "team": "Backend Platform",
-        "skills": ["Python", "Go", "Kubernetes", "AWS"],
-        "projects": ["Payment System v2", "API Gateway"],
-        "next_review": "2025-12-15",
-        "vacation_days": 15,
-        "sick_days": 5
-    }
-
-    result = f"""
-👤 **Employee Profile**
-
-**Basic Information:**
-   • Name: {mock_employee['name']}
-   • Employee ID: {mock_employee['id']}
-   • Email: {mock_employee['email']}
-   • Phone: {mock_employee['phone']}
-
-**Position:**
-   • Role: {mock_employee['role']}
-   • Level: {mock_employee['level']}
-   • Department: {mock_employee['department']}
-   • Team: {mock_employee['team']}
-   • Manager: {mock_employee['manager']}
-
-**Employment Details:**
-   • Type: {mock_employee['employment_type']}
-   • Start Date: {mock_employee['start_date']}
-   • Next Review: {mock_employee['next_review']}
-
-**Location:**
-   • Office: {mock_employee['location']}
-   • Workspace: {mock_employee['office']}
-
-**Skills:**
-   {', '.join(mock_employee['skills'])}
-
-**Current Projects:**
-   • {chr(10).join(f"  • {p}" for p in mock_employee['projects'])}
-
-**Time Off Balance:**
-   • Vacation Days: {mock_employee['vacation_days']} remaining
-   • Sick Days: {mock_employee['sick_days']} remaining
-
-⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
+    return _EMPLOYEE_PROFILE_TEXT + f"\n\n⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
 
 @tool(
@@ -241,49 +308,15 @@ def get_org_chart(
         ├── Engineering Manager - Jane Smith..."
     """
     if department:
-        dept_lower = department.lower()
-        if "engineering" in dept_lower:
-            result = """
-🏢 **Engineering Department - Organization Chart**
-
-**Bob Johnson** - Chief Technology Officer
-├── **Jane Smith** - Engineering Manager
-│   ├── John Doe - Senior Software Engineer
-│   ├── Mike Chen - Software Engineer
-│   └── Sarah Lee - Junior Software Engineer
-└── **Alex Kumar** - Engineering Manager
-    ├── Tom Wilson - Senior DevOps Engineer
-    └── Lisa Park - DevOps Engineer
-            """.strip()
-        elif "hr" in dept_lower or "human" in dept_lower:
-            result = """
-🏢 **Human Resources Department - Organization Chart**
-
-**Alice Johnson** - HR Manager
-├── Mary Thompson - HR Specialist
-├── David Kim - Recruiter
-└── Emily Davis - HR Coordinator
-            """.strip()
+        words = set(_WORD_PATTERN.findall(department.lower()))
+        for keywords, chart in _ORG_CHARTS:
+            if keywords & words:
+                result = chart
+                break
         else:
             result = f"📋 Department '{department}' org chart coming soon..."
     else:
-        result = """
-🏢 **Company Organization Chart**
-
-**CEO** - Sarah Williams
-├── **CTO** - Bob Johnson (Technology)
-│   ├── Engineering Manager - Jane Smith
-│   └── Engineering Manager - Alex Kumar
-├── **CFO** - Michael Brown (Finance)
-│   ├── Senior Accountant - James Wilson
-│   └── Financial Analyst - Emma Davis
-├── **HR Manager** - Alice Johnson (Human Resources)
-│   ├── HR Specialist - Mary Thompson
-│   └── Recruiter - David Kim
-└── **CMO** - Rachel Green (Marketing)
-    ├── Marketing Manager - Carol White
-    └── Social Media Manager - Kevin Lee
-        """.strip()
+        result = _COMPANY_ORG_CHART
 
     result += f"\n\n⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
     return result
@@ -2,7 +2,26 @@
 
 from typing import Annotated
 from datetime import datetime, timedelta
+from functools import lru_cache
+import zlib
 from tools._decorators import tool
+from ._dates import parse_date
+
+# Leave type -> indicator emoji
+_LEAVE_EMOJIS = {
+    "vacation": "🏖️",
+    "sick": "🏥",
+    "personal": "👤",
+    "unpaid": "📅",
+}
+
+# Closing block of every request_leave confirmation
+_LEAVE_REQUEST_NEXT_STEPS = """**Next Steps:**
+   1. Your manager will review this request
+   2. You'll receive an email notification with the decision
+   3. Check leave balance and calendar for conflicts
+
+💡 **Tip:** You can check your request status using the leave request ID"""
 
 
 @tool(
@@ -32,9 +51,11 @@ def request_leave(
         >>> request_leave("2025-12-20", "2025-12-31", "vacation", "Holiday break")
         "Leave request submitted successfully..."
     """
+    now = datetime.now()
+
     try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
+        start = parse_date(start_date)
+        end = parse_date(end_date)
 
         if end < start:
             return "❌ **Error:** End date cannot be before start date"
@@ -45,19 +66,11 @@ def request_leave(
         return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
 
     # Calculate request ID
-    request_id = f"LR-{datetime.now().strftime('%Y%m%d')}-{hash(start_date) % 1000:03d}"
+    request_id = f"LR-{now.strftime('%Y%m%d')}-{zlib.crc32(start_date.encode()) % 1000:03d}"
 
-    # Leave type emojis
-    leave_emojis = {
-        "vacation": "🏖️",
-        "sick": "🏥",
-        "personal": "👤",
-        "unpaid": "📅"
-    }
-    emoji = leave_emojis.get(leave_type.lower(), "📅")
+    emoji = _LEAVE_EMOJIS.get(leave_type.lower(), "📅")
 
-    result = f"""
-✅ **Leave Request Submitted Successfully!**
+    parts = [f"""✅ **Leave Request Submitted Successfully!**
 
 {emoji} **Request ID:** {request_id}
 
@@ -72,24 +85,15 @@ def request_leave(
 **Manager:** Jane Smith
 
 **Request Timeline:**
-   • Submitted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-   • Expected Response: Within 2 business days
-    """.strip()
+   • Submitted: {now.strftime('%Y-%m-%d %H:%M:%S')}
+   • Expected Response: Within 2 business days"""]
 
     if reason:
-        result += f"\n\n**Reason:**\n   {reason}"
-
-    result += """
-
-**Next Steps:**
-   1. Your manager will review this request
-   2. You'll receive an email notification with the decision
-   3. Check leave balance and calendar for conflicts
+        parts.append(f"**Reason:**\n   {reason}")
 
-💡 **Tip:** You can check your request status using the leave request ID
-    """.strip()
+    parts.append(_LEAVE_REQUEST_NEXT_STEPS)
 
-    return result
+    return "\n\n".join(parts)
 
 
 @tool(
@@ -114,11 +118,29 @@ def check_leave_balance(
         "Leave Balance Summary:
         Vacation: 15 days remaining..."
     """
-    # Mock leave balance data
-    current_year = datetime.now().year
+    now = datetime.now()
+    return (
+        _leave_balance_body(now.year)
+        + f"\n\n⏰ **Last Updated:** {now.strftime('%Y-%m-%d %H:%M:%S')}"
+    )
 
-    result = f"""
-📊 **Leave Balance Summary - {current_year}**
+
+@lru_cache(maxsize=1)
+def _leave_balance_body(year: int) -> str:
+    """Render the mock leave balance summary for a year.
+
+    The summary only changes with the year, so it is built once and reused;
+    the caller appends the per-call timestamp.
+
+    Args:
+        year: Calendar year shown in the header
+
+    Returns:
+        Leave balance summary without the timestamp line
+    """
+    # Mock leave balance data
+    return f"""
+📊 **Leave Balance Summary - {year}**
 
 **Employee:** John Doe (EMP001)
 
@@ -146,12 +168,8 @@ def check_leave_balance(
    • Sick days carry over: No limit
    • Personal days: Use or lose
    • Notice required: 2 weeks for >5 consecutive days
-
-⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     """.strip()
 
-    return result
-
 
 @tool(
     domain="hr",
@@ -290,8 +308,7 @@ def review_leave_request(
     action_emoji = "✅" if action.lower() == "approve" else "❌"
     action_text = "Approved" if action.lower() == "approve" else "Denied"
 
-    result = f"""
-{action_emoji} **Leave Request {action_text}**
+    parts = [f"""{action_emoji} **Leave Request {action_text}**
 
 **Request ID:** {request_id}
 **Action:** {action_text}
@@ -301,21 +318,17 @@ def review_leave_request(
 **Request Details:**
    • Employee: John Doe (EMP001)
    • Type: Vacation
-   • Dates: Dec 20-31, 2025 (12 days)
-    """.strip()
+   • Dates: Dec 20-31, 2025 (12 days)"""]
 
     if comments:
-        result += f"\n\n**Manager Comments:**\n   \"{comments}\""
-
-    result += f"""
+        parts.append(f"**Manager Comments:**\n   \"{comments}\"")
 
-**Next Steps:**
+    parts.append(f"""**Next Steps:**
    • Employee has been notified via email
    • {"Calendar has been updated" if action.lower() == "approve" else "Employee can submit a new request"}
-   • {"HR has been notified of the approval" if action.lower() == "approve" else "Request has been archived"}
-    """.strip()
+   • {"HR has been notified of the approval" if action.lower() == "approve" else "Request has been archived"}""")
 
-    return result
+    return "\n\n".join(parts)
 
 
 @tool(
@@ -341,8 +354,10 @@ def get_team_calendar(
         >>> get_team_calendar("Engineering", "2025-12")
         "Engineering Team - December 2025 Leave Calendar..."
     """
+    now = datetime.now()
+
     if not month:
-        month = datetime.now().strftime("%Y-%m")
+        month = now.strftime("%Y-%m")
 
     try:
         month_date = datetime.strptime(month, "%Y-%m")
@@ -386,7 +401,7 @@ def get_team_calendar(
    • Ensure knowledge transfer before Dec 20
    • Set up on-call rotation for critical systems
 
-⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ **Last Updated:** {now.strftime('%Y-%m-%d %H:%M:%S')}
     """.strip()
 
     return result
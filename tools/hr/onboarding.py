@@ -2,50 +2,22 @@
 
 from typing import Annotated
 from datetime import datetime, timedelta
+from functools import lru_cache
+import zlib
 from tools._decorators import tool
+from ._dates import parse_date
 
+# Timestamp format for creation, submission and update times
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-@tool(
-    domain="hr",
-    description="Create onboarding checklist for new employee",
-    tags=["hr", "onboarding", "new-hire", "checklist", "welcome"],
-    mock=True,
-)
-def create_onboarding_checklist(
-    employee_name: Annotated[str, "New employee name"],
-    role: Annotated[str, "Job role/title"],
-    start_date: Annotated[str, "Start date (YYYY-MM-DD)"],
-    department: Annotated[str, "Department"] = "Engineering",
-) -> str:
-    """Create onboarding checklist for a new employee.
-
-    Args:
-        employee_name: Name of the new employee
-        role: Job title/role
-        start_date: Start date in YYYY-MM-DD format
-        department: Department name
-
-    Returns:
-        Formatted onboarding checklist
-
-    Example:
-        >>> create_onboarding_checklist("Alex Chen", "Software Engineer", "2025-12-01")
-        "Onboarding Checklist for Alex Chen..."
-    """
-    try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-    except ValueError:
-        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
-
-    checklist_id = f"OB-{start.strftime('%Y%m%d')}-{hash(employee_name) % 1000:03d}"
-
-    result = f"""
+# Onboarding checklist; only the header fields vary per call
+_CHECKLIST_FORMAT = """
 🎉 **Welcome Onboarding Checklist**
 
 **New Employee:** {employee_name}
 **Role:** {role}
 **Department:** {department}
-**Start Date:** {start.strftime('%A, %B %d, %Y')}
+**Start Date:** {start}
 **Checklist ID:** {checklist_id}
 
 ---
@@ -119,35 +91,72 @@ def create_onboarding_checklist(
    • IT Setup Guide: intranet/it-setup
    • Benefits Portal: benefits.company.com
    • Learning Platform: learn.company.com
-
-⏰ **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
-
-
-@tool(
-    domain="hr",
-    description="Get onboarding status and progress for new employee",
-    tags=["hr", "onboarding", "status", "progress", "tracking"],
-    mock=True,
-)
-def get_onboarding_status(
-    employee_id: Annotated[str, "Employee ID or name"],
-) -> str:
-    """Check onboarding progress for a new employee.
-
-    Args:
-        employee_id: Employee ID or name
-
-    Returns:
-        Onboarding progress report
-
-    Example:
-        >>> get_onboarding_status("EMP006")
-        "Onboarding Progress: 45% complete..."
-    """
-    result = """
+""".strip()
+
+# Orientation session details keyed by session type
+_SESSION_TYPES = {
+    "company": {
+        "title": "Company Orientation",
+        "duration": "2 hours",
+        "host": "Alice Johnson (HR Manager)",
+        "location": "Conference Room A",
+        "topics": (
+            "Company history and mission",
+            "Culture and values",
+            "Organizational structure",
+            "Employee handbook review",
+            "Q&A session",
+        ),
+    },
+    "department": {
+        "title": "Department Orientation",
+        "duration": "90 minutes",
+        "host": "Jane Smith (Engineering Manager)",
+        "location": "Engineering Area",
+        "topics": (
+            "Team structure and roles",
+            "Current projects overview",
+            "Development processes",
+            "Tools and workflows",
+            "Team rituals and meetings",
+        ),
+    },
+    "it": {
+        "title": "IT Systems Setup",
+        "duration": "1 hour",
+        "host": "IT Support Team",
+        "location": "IT Help Desk",
+        "topics": (
+            "Account setup and passwords",
+            "Email and calendar",
+            "VPN and security",
+            "Software installations",
+            "Support resources",
+        ),
+    },
+    "benefits": {
+        "title": "Benefits Orientation",
+        "duration": "1 hour",
+        "host": "Alice Johnson (HR Manager)",
+        "location": "HR Office",
+        "topics": (
+            "Health insurance options",
+            "401(k) and retirement",
+            "PTO and leave policies",
+            "Additional perks",
+            "Enrollment process",
+        ),
+    },
+}
+
+# Numbered agenda for each session type, rendered once at import
+_SESSION_AGENDAS = {
+    session_type: "\n".join(f"   {i}. {topic}" for i, topic in enumerate(session["topics"], 1))
+    for session_type, session in _SESSION_TYPES.items()
+}
+
+# Mock onboarding progress report, without its timestamp line
+_ONBOARDING_STATUS_REPORT = """
 📊 **Onboarding Progress Report**
 
 **Employee:** Alex Chen (EMP006)
@@ -216,11 +225,157 @@ def get_onboarding_status(
 
 **Manager Feedback:**
    "Alex is settling in well. Very engaged during meetings and asking great questions."
+""".strip()
 
-⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
+# Buddy assignment confirmation; only the pairing fields vary per call
+_BUDDY_ASSIGNMENT_FORMAT = """
+🤝 **Onboarding Buddy Assigned**
 
-    return result
+**New Employee:** {new_employee}
+**Onboarding Buddy:** {buddy_name}
+**Assignment Reason:** {reason}
+
+**Buddy Profile:**
+   • Name: {buddy_name}
+   • Role: Software Engineer
+   • Department: Engineering
+   • Experience: 2 years at company
+   • Previous buddy assignments: 3 successful onboardings
+   • Contact: {buddy_email}
+
+**Buddy Responsibilities:**
+   ✓ Be the go-to person for questions
+   ✓ Help navigate company culture
+   ✓ Introduce to team members
+   ✓ Weekly check-in meetings (first month)
+   ✓ Lunch/coffee chats
+   ✓ Share tips and best practices
+   ✓ Provide informal feedback
+
+**First Meeting Scheduled:**
+   • Date: First day, after IT setup
+   • Duration: 30 minutes
+   • Format: Informal coffee chat
+   • Location: Cafeteria
+
+**Meeting Cadence:**
+   • Week 1: Daily check-ins (15 min)
+   • Week 2-4: 3x per week (15 min)
+   • Month 2-3: Weekly (30 min)
+   • After 3 months: As needed
+
+**Resources for Buddy:**
+   • Buddy guide and checklist sent
+   • FAQ document shared
+   • Support from HR team
+   • Recognition in quarterly meeting
+
+**Success Metrics:**
+   • Regular check-ins completed
+   • New employee satisfaction score
+   • Integration milestones met
+   • 90-day retention
+
+**Support:**
+   • HR Contact: Alice Johnson
+   • Questions: hr@company.com
+   • Buddy Community: #onboarding-buddies
+
+💡 **Both parties have been notified via email with next steps!**
+""".strip()
+
+
+@tool(
+    domain="hr",
+    description="Create onboarding checklist for new employee",
+    tags=["hr", "onboarding", "new-hire", "checklist", "welcome"],
+    mock=True,
+)
+def create_onboarding_checklist(
+    employee_name: Annotated[str, "New employee name"],
+    role: Annotated[str, "Job role/title"],
+    start_date: Annotated[str, "Start date (YYYY-MM-DD)"],
+    department: Annotated[str, "Department"] = "Engineering",
+) -> str:
+    """Create onboarding checklist for a new employee.
+
+    Args:
+        employee_name: Name of the new employee
+        role: Job title/role
+        start_date: Start date in YYYY-MM-DD format
+        department: Department name
+
+    Returns:
+        Formatted onboarding checklist
+
+    Example:
+        >>> create_onboarding_checklist("Alex Chen", "Software Engineer", "2025-12-01")
+        "Onboarding Checklist for Alex Chen..."
+    """
+    try:
+        start = parse_date(start_date)
+    except ValueError:
+        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
+
+    checklist_id = f"OB-{start.strftime('%Y%m%d')}-{zlib.crc32(employee_name.encode()) % 1000:03d}"
+
+    return (
+        _checklist_body(employee_name, role, department, start, checklist_id)
+        + f"\n\n⏰ **Created:** {datetime.now().strftime(TIMESTAMP_FORMAT)}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _checklist_body(
+    employee_name: str,
+    role: str,
+    department: str,
+    start: datetime,
+    checklist_id: str,
+) -> str:
+    """Render an onboarding checklist, minus the creation timestamp.
+
+    Args:
+        employee_name: Name of the new employee
+        role: Job title/role
+        department: Department name
+        start: Parsed start date
+        checklist_id: Checklist identifier
+
+    Returns:
+        Checklist text
+    """
+    return _CHECKLIST_FORMAT.format(
+        employee_name=employee_name,
+        role=role,
+        department=department,
+        start=start.strftime('%A, %B %d, %Y'),
+        checklist_id=checklist_id,
+    )
+
+
+@tool(
+    domain="hr",
+    description="Get onboarding status and progress for new employee",
+    tags=["hr", "onboarding", "status", "progress", "tracking"],
+    mock=True,
+)
+def get_onboarding_status(
+    employee_id: Annotated[str, "Employee ID or name"],
+) -> str:
+    """Check onboarding progress for a new employee.
+
+    Args:
+        employee_id: Employee ID or name
+
+    Returns:
+        Onboarding progress report
+
+    Example:
+        >>> get_onboarding_status("EMP006")
+        "Onboarding Progress: 45% complete..."
+    """
+    return _ONBOARDING_STATUS_REPORT + f"\n\n⏰ **Last Updated:** {datetime.now().strftime(TIMESTAMP_FORMAT)}"
 
 
 @tool(
@@ -255,64 +410,33 @@ def schedule_orientation(
     except ValueError:
         return "❌ **Error:** Invalid date/time format"
 
-    session_types = {
-        "company": {
-            "title": "Company Orientation",
-            "duration": "2 hours",
-            "host": "Alice Johnson (HR Manager)",
-            "location": "Conference Room A",
-            "topics": [
-                "Company history and mission",
-                "Culture and values",
-                "Organizational structure",
-                "Employee handbook review",
-                "Q&A session"
-            ]
-        },
-        "department": {
-            "title": "Department Orientation",
-            "duration": "90 minutes",
-            "host": "Jane Smith (Engineering Manager)",
-            "location": "Engineering Area",
-            "topics": [
-                "Team structure and roles",
-                "Current projects overview",
-                "Development processes",
-                "Tools and workflows",
-                "Team rituals and meetings"
-            ]
-        },
-        "it": {
-            "title": "IT Systems Setup",
-            "duration": "1 hour",
-            "host": "IT Support Team",
-            "location": "IT Help Desk",
-            "topics": [
-                "Account setup and passwords",
-                "Email and calendar",
-                "VPN and security",
-                "Software installations",
-                "Support resources"
-            ]
-        },
-        "benefits": {
-            "title": "Benefits Orientation",
-            "duration": "1 hour",
-            "host": "Alice Johnson (HR Manager)",
-            "location": "HR Office",
-            "topics": [
-                "Health insurance options",
-                "401(k) and retirement",
-                "PTO and leave policies",
-                "Additional perks",
-                "Enrollment process"
-            ]
-        }
-    }
-
-    session = session_types.get(session_type.lower(), session_types["company"])
-
-    result = f"""
+    return (
+        _orientation_body(employee_name, session_type, session_date)
+        + f"\n\n⏰ **Scheduled:** {datetime.now().strftime(TIMESTAMP_FORMAT)}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _orientation_body(employee_name: str, session_type: str, session_date: datetime) -> str:
+    """Render an orientation confirmation, minus the scheduling timestamp.
+
+    Args:
+        employee_name: Name of the employee
+        session_type: Type of orientation (company, department, it, benefits)
+        session_date: Parsed session date and time
+
+    Returns:
+        Orientation confirmation text
+    """
+    session_type = session_type.lower()
+    if session_type not in _SESSION_TYPES:
+        session_type = "company"
+    session = _SESSION_TYPES[session_type]
+    agenda = _SESSION_AGENDAS[session_type]
+
+    invite_address = f"{employee_name.lstrip().partition(' ')[0].lower()}@company.com"
+
+    return f"""
 ✅ **Orientation Session Scheduled**
 
 📅 **{session['title']}**
@@ -325,12 +449,7 @@ def schedule_orientation(
 **Location:** {session['location']}
 
 **Agenda:**
-    """.strip()
-
-    for i, topic in enumerate(session['topics'], 1):
-        result += f"\n   {i}. {topic}"
-
-    result += f"""
+{agenda}
 
 **What to Bring:**
    • Notepad and pen
@@ -342,7 +461,7 @@ def schedule_orientation(
    • New hire welcome packet
 
 **Calendar Invite:**
-   ✅ Sent to {employee_name.split()[0].lower()}@company.com
+   ✅ Sent to {invite_address}
    ✅ Reminder set for 30 minutes before
 
 **Next Steps:**
@@ -351,12 +470,8 @@ def schedule_orientation(
    • Confirm attendance (reply to calendar invite)
 
 💡 **Note:** If you need to reschedule, please contact HR at least 24 hours in advance.
-
-⏰ **Scheduled:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     """.strip()
 
-    return result
-
 
 @tool(
     domain="hr",
@@ -391,62 +506,29 @@ def assign_onboarding_buddy(
     else:
         return "❌ **Error:** Please provide buddy_name or set auto_assign=True"
 
-    result = f"""
-🤝 **Onboarding Buddy Assigned**
-
-**New Employee:** {new_employee}
-**Onboarding Buddy:** {buddy_name}
-**Assignment Reason:** {reason}
-
-**Buddy Profile:**
-   • Name: {buddy_name}
-   • Role: Software Engineer
-   • Department: Engineering
-   • Experience: 2 years at company
-   • Previous buddy assignments: 3 successful onboardings
-   • Contact: {buddy_name.lower().replace(' ', '.')}@company.com
-
-**Buddy Responsibilities:**
-   ✓ Be the go-to person for questions
-   ✓ Help navigate company culture
-   ✓ Introduce to team members
-   ✓ Weekly check-in meetings (first month)
-   ✓ Lunch/coffee chats
-   ✓ Share tips and best practices
-   ✓ Provide informal feedback
-
-**First Meeting Scheduled:**
-   • Date: First day, after IT setup
-   • Duration: 30 minutes
-   • Format: Informal coffee chat
-   • Location: Cafeteria
-
-**Meeting Cadence:**
-   • Week 1: Daily check-ins (15 min)
-   • Week 2-4: 3x per week (15 min)
-   • Month 2-3: Weekly (30 min)
-   • After 3 months: As needed
+    return (
+        _buddy_assignment_body(new_employee, buddy_name, reason)
+        + f"\n\n⏰ **Assigned:** {datetime.now().strftime(TIMESTAMP_FORMAT)}"
+    )
 
-**Resources for Buddy:**
-   • Buddy guide and checklist sent
-   • FAQ document shared
-   • Support from HR team
-   • Recognition in quarterly meeting
 
-**Success Metrics:**
-   • Regular check-ins completed
-   • New employee satisfaction score
-   • Integration milestones met
-   • 90-day retention
-
-**Support:**
-   • HR Contact: Alice Johnson
-   • Questions: hr@company.com
-   • Buddy Community: #onboarding-buddies
+@lru_cache(maxsize=256)
+def _buddy_assignment_body(new_employee: str, buddy_name: str, reason: str) -> str:
+    """Render a buddy assignment, minus the assignment timestamp.
 
-💡 **Both parties have been notified via email with next steps!**
-
-⏰ **Assigned:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
+    Args:
+        new_employee: Name of new employee
+        buddy_name: Assigned buddy
+        reason: Why this buddy was chosen
 
-    return result
+    Returns:
+        Buddy assignment text
+    """
+    buddy_email = f"{buddy_name.lower().replace(' ', '.')}@company.com"
+
+    return _BUDDY_ASSIGNMENT_FORMAT.format(
+        new_employee=new_employee,
+        buddy_name=buddy_name,
+        reason=reason,
+        buddy_email=buddy_email,
+    )
@@ -2,7 +2,107 @@
 
 from typing import Annotated
 from datetime import datetime, timedelta
+import zlib
 from tools._decorators import tool
+from ._dates import parse_date
+
+# Timestamp format for creation, submission and update times
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Date format for due, target and review dates
+DATE_FORMAT = "%Y-%m-%d"
+
+# Goal type -> review period label
+_GOAL_PERIODS = {
+    "quarterly": "Q4 2025",
+    "annual": "2025",
+    "project": "Project-based",
+}
+
+# Review rating -> indicator emoji
+_RATING_EMOJIS = {
+    "exceeds": "⭐",
+    "meets": "✅",
+    "needs-improvement": "⚠️",
+    "unsatisfactory": "❌",
+}
+
+# Feedback type -> indicator emoji
+_FEEDBACK_EMOJIS = {
+    "praise": "🌟",
+    "constructive": "💡",
+    "peer-review": "👥",
+}
+
+# Review meetings always start at 2:00 PM; the base for end-time arithmetic
+_REVIEW_MEETING_START = datetime(1900, 1, 1, 14, 0)
+
+# Current review status shown by get_review_status; only the due date varies
+_REVIEW_STATUS_FORMAT = """📊 **Performance Review Status**
+
+**Employee:** John Doe (EMP001)
+**Current Period:** Q4 2025
+
+**Upcoming Review:**
+   • Type: Quarterly Review
+   • Due Date: {due_date}
+   • Reviewer: Jane Smith (Manager)
+   • Status: In Progress
+
+**Current Goals Progress:**
+   1. ✅ Launch Feature X - 100% Complete
+   2. 🔄 Improve Code Coverage to 80% - 65% Complete
+   3. 🔄 Mentor Junior Engineer - In Progress
+   4. ⏳ Reduce Tech Debt - Not Started
+
+**Recent Feedback:**
+   • "Great work on the feature launch!" - Jane Smith (2 days ago)
+   • "Code reviews are thorough and helpful" - Mike Chen (1 week ago)"""
+
+# Past review summary appended by get_review_status when history is requested
+_REVIEW_HISTORY = """**Performance History:**
+
+**Q3 2025:**
+   • Rating: ⭐ Exceeds Expectations
+   • Goals Achievement: 100% (4/4)
+   • Key Highlight: Led successful project delivery
+   • Salary Impact: +5% increase
+
+**Q2 2025:**
+   • Rating: ✅ Meets Expectations
+   • Goals Achievement: 75% (3/4)
+   • Key Highlight: Improved system reliability
+   • Development Focus: Leadership skills
+
+**Q1 2025:**
+   • Rating: ✅ Meets Expectations
+   • Goals Achievement: 100% (4/4)
+   • Key Highlight: Strong technical contributions
+   • Note: First review in role
+
+**Annual 2024:**
+   • Rating: ⭐ Exceeds Expectations
+   • Goals Achievement: 90% (9/10)
+   • Promotion: Promoted to Senior Engineer
+   • Bonus: 15% performance bonus
+
+**Trends:**
+   • Performance: ↗️ Improving
+   • Goal Achievement: 🎯 Consistently high
+   • Growth: 📈 On track for next level"""
+
+# Closing development plan and career path shown by get_review_status
+_DEVELOPMENT_PLAN = """**Development Plan:**
+   • Enroll in leadership training
+   • Present at next engineering all-hands
+   • Lead one major project per quarter
+   • Continue mentoring program
+
+**Career Path:**
+   • Current: L5 Senior Software Engineer
+   • Next Level: L6 Staff Engineer
+   • Target Timeline: 6-12 months
+   • Requirements: Leadership + technical excellence"""
 
 
 @tool(
@@ -30,17 +130,27 @@ def set_performance_goals(
         >>> set_performance_goals("EMP001", "quarterly", "Launch feature X, Improve code coverage to 80%")
         "Performance goals set successfully..."
     """
-    if not goals:
+    now = datetime.now()
+
+    # Drop blanks left by stray or trailing commas ("a, b,")
+    goal_list = [goal for goal in map(str.strip, goals.split(",")) if goal]
+
+    if not goal_list:
         return "❌ **Error:** Please provide at least one goal"
 
-    goal_list = [g.strip() for g in goals.split(",")]
+    period = _GOAL_PERIODS.get(goal_type.lower(), "Q4 2025")
 
-    period_map = {
-        "quarterly": "Q4 2025",
-        "annual": "2025",
-        "project": "Project-based"
-    }
-    period = period_map.get(goal_type.lower(), "Q4 2025")
+    checkin_date = (now + timedelta(days=45)).strftime(DATE_FORMAT)
+    target_date = (now + timedelta(days=90)).strftime(DATE_FORMAT)
+    weight = 100 // len(goal_list)
+    goal_blocks = "\n\n".join(
+        f"{i}. **{goal}**\n"
+        f"   • Status: Not Started\n"
+        f"   • Target Date: {target_date}\n"
+        f"   • Weight: {weight}%\n"
+        f"   • Metrics: To be defined"
+        for i, goal in enumerate(goal_list, 1)
+    )
 
     result = f"""
 🎯 **Performance Goals Set**
@@ -51,20 +161,12 @@ def set_performance_goals(
 **Status:** Active
 
 **Goals ({len(goal_list)}):**
-    """.strip()
 
-    for i, goal in enumerate(goal_list, 1):
-        result += f"\n\n{i}. **{goal}**"
-        result += f"\n   • Status: Not Started"
-        result += f"\n   • Target Date: {(datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d')}"
-        result += f"\n   • Weight: {100 // len(goal_list)}%"
-        result += f"\n   • Metrics: To be defined"
-
-    result += f"""
+{goal_blocks}
 
 **Review Schedule:**
-   • Mid-period Check-in: {(datetime.now() + timedelta(days=45)).strftime('%Y-%m-%d')}
-   • Final Review: {(datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d')}
+   • Mid-period Check-in: {checkin_date}
+   • Final Review: {target_date}
    • Manager: Jane Smith
 
 **Success Criteria:**
@@ -80,7 +182,7 @@ def set_performance_goals(
 
 💡 **Tip:** Update progress weekly to stay on track!
 
-⏰ **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ **Created:** {now.strftime(TIMESTAMP_FORMAT)}
     """.strip()
 
     return result
@@ -116,18 +218,13 @@ def submit_performance_review(
                 "Strong technical skills", "Work on communication")
         "Performance review submitted..."
     """
-    rating_emojis = {
-        "exceeds": "⭐",
-        "meets": "✅",
-        "needs-improvement": "⚠️",
-        "unsatisfactory": "❌"
-    }
-    emoji = rating_emojis.get(rating.lower(), "✅")
+    now = datetime.now()
 
-    review_id = f"REV-{datetime.now().strftime('%Y%m%d')}-{hash(employee_id) % 1000:03d}"
+    emoji = _RATING_EMOJIS.get(rating.lower(), "✅")
 
-    result = f"""
-{emoji} **Performance Review Submitted**
+    review_id = f"REV-{now.strftime('%Y%m%d')}-{zlib.crc32(employee_id.encode()) % 1000:03d}"
+
+    parts = [f"""{emoji} **Performance Review Submitted**
 
 **Review ID:** {review_id}
 **Employee:** John Doe (EMP001)
@@ -139,38 +236,29 @@ def submit_performance_review(
 
 **PERFORMANCE SUMMARY:**
 
-**Overall Assessment:** {emoji} {rating.title()}
-    """.strip()
+**Overall Assessment:** {emoji} {rating.title()}"""]
 
     if strengths:
-        result += f"""
-
-**Key Strengths & Achievements:**
+        parts.append(f"""**Key Strengths & Achievements:**
    {strengths}
 
 **Specific Examples:**
    • Successfully led the migration to microservices
    • Mentored 2 junior engineers
    • Improved system performance by 40%
-   • Consistently delivered high-quality code
-        """.strip()
+   • Consistently delivered high-quality code""")
 
     if areas_for_improvement:
-        result += f"""
-
-**Areas for Development:**
+        parts.append(f"""**Areas for Development:**
    {areas_for_improvement}
 
 **Development Plan:**
    • Take communication skills workshop
    • Practice presenting in team meetings
    • Shadow senior team members
-   • Set specific improvement goals
-        """.strip()
+   • Set specific improvement goals""")
 
-    result += f"""
-
-**Core Competencies Assessment:**
+    parts.append(f"""**Core Competencies Assessment:**
    Technical Skills: {emoji} Exceeds Expectations
    Communication: ✅ Meets Expectations
    Collaboration: {emoji} Exceeds Expectations
@@ -194,7 +282,7 @@ def submit_performance_review(
    • Bonus: Eligible for performance bonus
    • Development: Leadership training
 
-**Next Review:** {(datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d')}
+**Next Review:** {(now + timedelta(days=90)).strftime(DATE_FORMAT)}
 
 **Status:** Pending Employee Acknowledgment
 
@@ -205,10 +293,9 @@ def submit_performance_review(
    4. HR will review and finalize
    5. Development plan created
 
-⏰ **Submitted:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
+⏰ **Submitted:** {now.strftime(TIMESTAMP_FORMAT)}""")
 
-    return result
+    return "\n\n".join(parts)
 
 
 @tool(
@@ -234,82 +321,17 @@ def get_review_status(
         >>> get_review_status("EMP001", include_history=True)
         "Current review status and historical performance..."
     """
-    result = f"""
-📊 **Performance Review Status**
+    now = datetime.now()
 
-**Employee:** John Doe (EMP001)
-**Current Period:** Q4 2025
+    status = _REVIEW_STATUS_FORMAT.format(
+        due_date=(now + timedelta(days=30)).strftime(DATE_FORMAT)
+    )
+    updated = f"⏰ **Last Updated:** {now.strftime(TIMESTAMP_FORMAT)}"
 
-**Upcoming Review:**
-   • Type: Quarterly Review
-   • Due Date: {(datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')}
-   • Reviewer: Jane Smith (Manager)
-   • Status: In Progress
-
-**Current Goals Progress:**
-   1. ✅ Launch Feature X - 100% Complete
-   2. 🔄 Improve Code Coverage to 80% - 65% Complete
-   3. 🔄 Mentor Junior Engineer - In Progress
-   4. ⏳ Reduce Tech Debt - Not Started
+    if not include_history:
+        return f"{status}\n\n{_DEVELOPMENT_PLAN}\n\n{updated}"
 
-**Recent Feedback:**
-   • "Great work on the feature launch!" - Jane Smith (2 days ago)
-   • "Code reviews are thorough and helpful" - Mike Chen (1 week ago)
-    """.strip()
-
-    if include_history:
-        result += """
-
-**Performance History:**
-
-**Q3 2025:**
-   • Rating: ⭐ Exceeds Expectations
-   • Goals Achievement: 100% (4/4)
-   • Key Highlight: Led successful project delivery
-   • Salary Impact: +5% increase
-
-**Q2 2025:**
-   • Rating: ✅ Meets Expectations
-   • Goals Achievement: 75% (3/4)
-   • Key Highlight: Improved system reliability
-   • Development Focus: Leadership skills
-
-**Q1 2025:**
-   • Rating: ✅ Meets Expectations
-   • Goals Achievement: 100% (4/4)
-   • Key Highlight: Strong technical contributions
-   • Note: First review in role
-
-**Annual 2024:**
-   • Rating: ⭐ Exceeds Expectations
-   • Goals Achievement: 90% (9/10)
-   • Promotion: Promoted to Senior Engineer
-   • Bonus: 15% performance bonus
-
-**Trends:**
-   • Performance: ↗️ Improving
-   • Goal Achievement: 🎯 Consistently high
-   • Growth: 📈 On track for next level
-        """.strip()
-
-    result += f"""
-
-**Development Plan:**
-   • Enroll in leadership training
-   • Present at next engineering all-hands
-   • Lead one major project per quarter
-   • Continue mentoring program
-
-**Career Path:**
-   • Current: L5 Senior Software Engineer
-   • Next Level: L6 Staff Engineer
-   • Target Timeline: 6-12 months
-   • Requirements: Leadership + technical excellence
-
-⏰ **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
+    return f"{status}\n\n{_REVIEW_HISTORY}\n\n{_DEVELOPMENT_PLAN}\n\n{updated}"
 
 
 @tool(
@@ -339,12 +361,7 @@ def give_feedback(
         >>> give_feedback("John Doe", "praise", "Excellent work on the API redesign!")
         "Feedback submitted successfully..."
     """
-    feedback_emojis = {
-        "praise": "🌟",
-        "constructive": "💡",
-        "peer-review": "👥"
-    }
-    emoji = feedback_emojis.get(feedback_type.lower(), "💬")
+    emoji = _FEEDBACK_EMOJIS.get(feedback_type.lower(), "💬")
 
     from_text = "Anonymous" if anonymous else "Jane Smith"
 
@@ -354,7 +371,7 @@ def give_feedback(
 **To:** {recipient}
 **From:** {from_text}
 **Type:** {feedback_type.title()}
-**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Date:** {datetime.now().strftime(TIMESTAMP_FORMAT)}
 
 **Feedback:**
 {feedback_text}
@@ -404,7 +421,7 @@ def schedule_review_meeting(
         "Review meeting scheduled..."
     """
     try:
-        meeting_date = datetime.strptime(date, "%Y-%m-%d")
+        meeting_date = parse_date(date)
     except ValueError:
         return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
 
@@ -415,7 +432,7 @@ def schedule_review_meeting(
 **Employee:** John Doe (EMP001)
 **Reviewer:** Jane Smith (Manager)
 **Date:** {meeting_date.strftime('%A, %B %d, %Y')}
-**Time:** 2:00 PM - {(datetime.strptime('14:00', '%H:%M') + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')}
+**Time:** 2:00 PM - {(_REVIEW_MEETING_START + timedelta(minutes=duration_minutes)).strftime('%I:%M %p')}
 **Duration:** {duration_minutes} minutes
 **Location:** Conference Room B (or Zoom link sent)
 
@@ -460,7 +477,7 @@ def schedule_review_meeting(
    • Copy provided to employee
    • Stored in HR system
 
-⏰ **Scheduled:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+⏰ **Scheduled:** {datetime.now().strftime(TIMESTAMP_FORMAT)}
     """.strip()
 
     return result
@@ -2,80 +2,126 @@
 
 from typing import Annotated
 from datetime import datetime, timedelta
+from functools import lru_cache
+import zlib
 from tools._decorators import tool
+from ._dates import parse_date
 
+# Timestamp format for logged, generated and submitted times
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-@tool(
-    domain="hr",
-    description="Log work hours for timesheet",
-    tags=["hr", "time", "timesheet", "hours", "tracking"],
-    mock=True,
-)
-def log_hours(
-    date: Annotated[str, "Date (YYYY-MM-DD)"] = "",
-    hours: Annotated[float, "Hours worked"] = 8.0,
-    project: Annotated[str, "Project or task name"] = "General",
-    description: Annotated[str, "Work description"] = "",
-) -> str:
-    """Log work hours for a specific date.
+# Date format for approval and pay dates
+DATE_FORMAT = "%Y-%m-%d"
 
-    Args:
-        date: Date to log hours (defaults to today)
-        hours: Number of hours worked
-        project: Project or task name
-        description: Description of work done
+# Timesheet period -> (display label, days from period start to period end)
+_TIMESHEET_PERIODS = {
+    "week": ("Week", 6),
+    "month": ("Month", 30),
+    "pay-period": ("Pay Period", 13),
+}
 
-    Returns:
-        Hours logged confirmation
+# Attendance period -> display label
+_ATTENDANCE_PERIODS = {
+    "month": "November 2025",
+    "quarter": "Q4 2025",
+    "year": "2025",
+}
 
-    Example:
-        >>> log_hours("2025-11-16", 8.5, "API Project", "Implemented authentication")
-        "8.5 hours logged successfully..."
-    """
-    if not date:
-        date = datetime.now().strftime("%Y-%m-%d")
+# Overtime request confirmation; wording that depends on pre-approval comes
+# from _OVERTIME_VARIANTS
+_OVERTIME_FORMAT = """{icon} **Overtime Request {verb}**
 
-    try:
-        log_date = datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
-        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
+**Request ID:** {request_id}
+**Employee:** John Doe (EMP001)
+**Date:** {ot_date}
 
-    if hours < 0 or hours > 24:
-        return "❌ **Error:** Hours must be between 0 and 24"
+**Overtime Details:**
+   ⏰ Hours: {hours:.1f} hours
+   💰 Rate: ${overtime_rate:.2f}/hour (1.5x regular)
+   💵 Total Pay: ${overtime_pay:.2f}
+   🔖 Pre-approved: {pre_approved}
 
-    entry_id = f"TS-{log_date.strftime('%Y%m%d')}-{hash(project) % 1000:03d}"
+**Reason:**
+   {reason}
 
-    # Determine if overtime
-    is_overtime = hours > 8
-    regular_hours = min(hours, 8)
-    overtime_hours = max(hours - 8, 0)
+**Status:** {status}
+
+**Approval Process:**
+{approval_steps}
+
+**Company Overtime Policy:**
+   • Overtime must be approved in advance (when possible)
+   • Rate: 1.5x regular hourly rate
+   • Maximum: 12 hours per day
+   • Weekend work: 2x rate (if applicable)
+   • Holiday work: 2.5x rate
+
+**This Pay Period:**
+   • Total Overtime: {period_hours:.1f} hours
+   • Total OT Pay: ${period_pay:.2f}
+   • Regular Hours: 38.5 hours
+
+**Next Steps:**
+   {next_step}
+   • Track status with request ID
+   • Contact HR with questions
 
-    result = f"""
+💡 {closing}
+
+⏰ **Submitted:** {submitted}"""
+
+# Pre-approval-dependent fields of _OVERTIME_FORMAT, keyed by pre_approved
+_OVERTIME_VARIANTS = {
+    True: {
+        "icon": "✅",
+        "verb": "Logged",
+        "pre_approved": "Yes",
+        "status": "Approved - Will be included in next payroll",
+        "approval_steps": """   ✅ Pre-approved by manager
+   ✅ Hours logged in timesheet
+   ✅ Forwarded to payroll
+   • Pay Date: Next pay period""",
+        "next_step": "• Hours will appear in next timesheet",
+        "closing": "Thank you for your extra effort!",
+    },
+    False: {
+        "icon": "⏳",
+        "verb": "Submitted",
+        "pre_approved": "No",
+        "status": "Pending Manager Approval",
+        "approval_steps": """   1. ⏳ Manager review (Jane Smith)
+   2. ⏳ HR verification
+   3. ⏳ Payroll processing
+   • Expected Response: 1-2 business days""",
+        "next_step": "• Wait for manager approval",
+        "closing": "Reminder: Get pre-approval for planned overtime",
+    },
+}
+
+# Hours-logged confirmation; the overtime line is blank for regular days
+_HOURS_LOGGED_FORMAT = """
 ✅ **Work Hours Logged**
 
 **Entry ID:** {entry_id}
 **Employee:** John Doe (EMP001)
-**Date:** {log_date.strftime('%A, %B %d, %Y')}
+**Date:** {log_date}
 
 **Hours Breakdown:**
    ⏰ Regular Hours: {regular_hours:.1f}
-   {"⚡ Overtime Hours: " + f"{overtime_hours:.1f}" if is_overtime else ""}
+   {overtime_line}
    📊 Total Hours: {hours:.1f}
 
 **Project/Task:** {project}
-    """.strip()
-
-    if description:
-        result += f"\n**Description:** {description}"
-
-    result += f"""
+""".strip()
 
+# Weekly summary appended after the logged entry
+_WEEKLY_SUMMARY_FORMAT = """
 **Weekly Summary (Current Week):**
    • Monday: 8.0 hours
    • Tuesday: 8.0 hours
    • Wednesday: {hours:.1f} hours (today)
-   • Total This Week: {16 + hours:.1f} hours
-   • Remaining: {40 - (16 + hours):.1f} hours (for 40hr week)
+   • Total This Week: {week_total:.1f} hours
+   • Remaining: {remaining:.1f} hours (for 40hr week)
 
 **Timesheet Status:**
    • Period: Nov 11-17, 2025
@@ -90,64 +136,16 @@ def log_hours(
 
 💡 **Reminder:** Log hours daily for accurate tracking!
 
-⏰ **Logged:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
+⏰ **Logged:** {logged}
+""".strip()
 
-
-@tool(
-    domain="hr",
-    description="Get timesheet summary for a period",
-    tags=["hr", "timesheet", "summary", "hours", "report"],
-    mock=True,
-)
-def get_timesheet_summary(
-    period: Annotated[str, "Period: 'week', 'month', 'pay-period'"] = "week",
-    start_date: Annotated[str, "Start date (YYYY-MM-DD) - optional"] = "",
-) -> str:
-    """Get timesheet summary for a period.
-
-    Args:
-        period: Time period to summarize
-        start_date: Optional start date
-
-    Returns:
-        Timesheet summary
-
-    Example:
-        >>> get_timesheet_summary("week")
-        "Weekly timesheet summary: 40 hours..."
-    """
-    if start_date:
-        try:
-            period_start = datetime.strptime(start_date, "%Y-%m-%d")
-        except ValueError:
-            return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
-    else:
-        # Default to current week start (Monday)
-        today = datetime.now()
-        period_start = today - timedelta(days=today.weekday())
-
-    if period == "week":
-        period_end = period_start + timedelta(days=6)
-        period_label = "Week"
-    elif period == "month":
-        period_end = period_start + timedelta(days=30)
-        period_label = "Month"
-    elif period == "pay-period":
-        period_end = period_start + timedelta(days=13)
-        period_label = "Pay Period"
-    else:
-        period_end = period_start + timedelta(days=6)
-        period_label = "Week"
-
-    result = f"""
+# Mock timesheet summary; only the period dates and status vary
+_TIMESHEET_SUMMARY_FORMAT = """
 📊 **Timesheet Summary - {period_label}**
 
 **Employee:** John Doe (EMP001)
-**Period:** {period_start.strftime('%b %d')} - {period_end.strftime('%b %d, %Y')}
-**Status:** {"Submitted" if datetime.now() > period_end else "In Progress"}
+**Period:** {period_start} - {period_end}
+**Status:** {status}
 
 **Hours Breakdown:**
 
@@ -177,66 +175,30 @@ def get_timesheet_summary(
    • Non-Billable: 9.0 hours (22%)
 
 **Approval Status:**
-   • Submitted: {(period_end + timedelta(days=2)).strftime('%Y-%m-%d')}
+   • Submitted: {submitted}
    • Approved By: Jane Smith
-   • Approved On: {(period_end + timedelta(days=3)).strftime('%Y-%m-%d')}
+   • Approved On: {approved}
    • Status: ✅ Approved
 
 **Payment Information:**
    • Regular Pay: $3,080.00 (38.5 hrs × $80/hr)
    • Overtime Pay: $300.00 (2.5 hrs × $120/hr)
    • Total Gross: $3,380.00
-   • Pay Date: {(period_end + timedelta(days=10)).strftime('%Y-%m-%d')}
+   • Pay Date: {pay_date}
 
 💡 **Performance:** On track with expected hours
 
-⏰ **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
-
-
-@tool(
-    domain="hr",
-    description="Submit timesheet for approval",
-    tags=["hr", "timesheet", "submit", "approval"],
-    mock=True,
-)
-def submit_timesheet(
-    period_start: Annotated[str, "Period start date (YYYY-MM-DD)"],
-    period_end: Annotated[str, "Period end date (YYYY-MM-DD)"],
-) -> str:
-    """Submit timesheet for manager approval.
-
-    Args:
-        period_start: Start of the period
-        period_end: End of the period
-
-    Returns:
-        Submission confirmation
-
-    Example:
-        >>> submit_timesheet("2025-11-11", "2025-11-17")
-        "Timesheet submitted for approval..."
-    """
-    try:
-        start = datetime.strptime(period_start, "%Y-%m-%d")
-        end = datetime.strptime(period_end, "%Y-%m-%d")
-    except ValueError:
-        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
-
-    if end < start:
-        return "❌ **Error:** End date must be after start date"
+⏰ **Generated:** {generated}
+""".strip()
 
-    submission_id = f"TS-SUB-{start.strftime('%Y%m%d')}"
-
-    result = f"""
+# Timesheet submission confirmation
+_SUBMISSION_FORMAT = """
 ✅ **Timesheet Submitted for Approval**
 
 **Submission ID:** {submission_id}
 **Employee:** John Doe (EMP001)
-**Period:** {start.strftime('%b %d')} - {end.strftime('%b %d, %Y')}
-**Submitted:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Period:** {start} - {end}
+**Submitted:** {submitted}
 
 **Summary:**
    • Total Hours: 41.0
@@ -273,10 +235,169 @@ def submit_timesheet(
 
 💡 **Tip:** Ensure all hours are accurate before submitting!
 
-⏰ **Submitted:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
+⏰ **Submitted:** {submitted}
+""".strip()
+
+
+@tool(
+    domain="hr",
+    description="Log work hours for timesheet",
+    tags=["hr", "time", "timesheet", "hours", "tracking"],
+    mock=True,
+)
+def log_hours(
+    date: Annotated[str, "Date (YYYY-MM-DD)"] = "",
+    hours: Annotated[float, "Hours worked"] = 8.0,
+    project: Annotated[str, "Project or task name"] = "General",
+    description: Annotated[str, "Work description"] = "",
+) -> str:
+    """Log work hours for a specific date.
+
+    Args:
+        date: Date to log hours (defaults to today)
+        hours: Number of hours worked
+        project: Project or task name
+        description: Description of work done
+
+    Returns:
+        Hours logged confirmation
 
-    return result
+    Example:
+        >>> log_hours("2025-11-16", 8.5, "API Project", "Implemented authentication")
+        "8.5 hours logged successfully..."
+    """
+    now = datetime.now()
+
+    if not date:
+        date = now.strftime(DATE_FORMAT)
+
+    try:
+        log_date = parse_date(date)
+    except ValueError:
+        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
+
+    if hours < 0 or hours > 24:
+        return "❌ **Error:** Hours must be between 0 and 24"
+
+    entry_id = f"TS-{log_date.strftime('%Y%m%d')}-{zlib.crc32(project.encode()) % 1000:03d}"
+
+    # Determine if overtime
+    is_overtime = hours > 8
+    regular_hours = min(hours, 8)
+    overtime_hours = max(hours - 8, 0)
+    overtime_line = f"⚡ Overtime Hours: {overtime_hours:.1f}" if is_overtime else ""
+
+    result = _HOURS_LOGGED_FORMAT.format(
+        entry_id=entry_id,
+        log_date=log_date.strftime('%A, %B %d, %Y'),
+        regular_hours=regular_hours,
+        overtime_line=overtime_line,
+        hours=hours,
+        project=project,
+    )
+
+    if description:
+        result += f"\n**Description:** {description}"
+
+    return result + "\n\n" + _WEEKLY_SUMMARY_FORMAT.format(
+        hours=hours,
+        week_total=16 + hours,
+        remaining=40 - (16 + hours),
+        logged=now.strftime(TIMESTAMP_FORMAT),
+    )
+
+
+@tool(
+    domain="hr",
+    description="Get timesheet summary for a period",
+    tags=["hr", "timesheet", "summary", "hours", "report"],
+    mock=True,
+)
+def get_timesheet_summary(
+    period: Annotated[str, "Period: 'week', 'month', 'pay-period'"] = "week",
+    start_date: Annotated[str, "Start date (YYYY-MM-DD) - optional"] = "",
+) -> str:
+    """Get timesheet summary for a period.
+
+    Args:
+        period: Time period to summarize
+        start_date: Optional start date
+
+    Returns:
+        Timesheet summary
+
+    Example:
+        >>> get_timesheet_summary("week")
+        "Weekly timesheet summary: 40 hours..."
+    """
+    now = datetime.now()
+
+    if start_date:
+        try:
+            period_start = parse_date(start_date)
+        except ValueError:
+            return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
+    else:
+        # Default to current week start (Monday)
+        period_start = now - timedelta(days=now.weekday())
+
+    period_label, period_days = _TIMESHEET_PERIODS.get(period, _TIMESHEET_PERIODS["week"])
+    period_end = period_start + timedelta(days=period_days)
+
+    return _TIMESHEET_SUMMARY_FORMAT.format(
+        period_label=period_label,
+        period_start=period_start.strftime('%b %d'),
+        period_end=period_end.strftime('%b %d, %Y'),
+        status="Submitted" if now > period_end else "In Progress",
+        submitted=(period_end + timedelta(days=2)).strftime(DATE_FORMAT),
+        approved=(period_end + timedelta(days=3)).strftime(DATE_FORMAT),
+        pay_date=(period_end + timedelta(days=10)).strftime(DATE_FORMAT),
+        generated=now.strftime(TIMESTAMP_FORMAT),
+    )
+
+
+@tool(
+    domain="hr",
+    description="Submit timesheet for approval",
+    tags=["hr", "timesheet", "submit", "approval"],
+    mock=True,
+)
+def submit_timesheet(
+    period_start: Annotated[str, "Period start date (YYYY-MM-DD)"],
+    period_end: Annotated[str, "Period end date (YYYY-MM-DD)"],
+) -> str:
+    """Submit timesheet for manager approval.
+
+    Args:
+        period_start: Start of the period
+        period_end: End of the period
+
+    Returns:
+        Submission confirmation
+
+    Example:
+        >>> submit_timesheet("2025-11-11", "2025-11-17")
+        "Timesheet submitted for approval..."
+    """
+    now = datetime.now()
+
+    try:
+        start = parse_date(period_start)
+        end = parse_date(period_end)
+    except ValueError:
+        return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
+
+    if end < start:
+        return "❌ **Error:** End date must be after start date"
+
+    submission_id = f"TS-SUB-{start.strftime('%Y%m%d')}"
+
+    return _SUBMISSION_FORMAT.format(
+        submission_id=submission_id,
+        start=start.strftime('%b %d'),
+        end=end.strftime('%b %d, %Y'),
+        submitted=now.strftime(TIMESTAMP_FORMAT),
+    )
 
 
 @tool(
@@ -302,14 +423,25 @@ def get_attendance_record(
         >>> get_attendance_record("EMP001", "month")
         "Attendance record for November 2025..."
     """
-    period_map = {
-        "month": "November 2025",
-        "quarter": "Q4 2025",
-        "year": "2025"
-    }
-    period_label = period_map.get(period.lower(), "November 2025")
-
-    result = f"""
+    period_label = _ATTENDANCE_PERIODS.get(period.lower(), "November 2025")
+
+    return (
+        _attendance_body(period_label)
+        + f"\n\n⏰ **Generated:** {datetime.now().strftime(TIMESTAMP_FORMAT)}"
+    )
+
+
+@lru_cache(maxsize=8)
+def _attendance_body(period_label: str) -> str:
+    """Render an attendance record, minus the generation timestamp.
+
+    Args:
+        period_label: Display label for the requested period
+
+    Returns:
+        Attendance record text
+    """
+    return f"""
 📅 **Attendance Record**
 
 **Employee:** John Doe (EMP001)
@@ -365,12 +497,8 @@ def get_attendance_record(
    • Dec 20-31: Approved Vacation (12 days)
 
 💡 **Status:** Excellent attendance record!
-
-⏰ **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     """.strip()
 
-    return result
-
 
 @tool(
     domain="hr",
@@ -400,78 +528,29 @@ def request_overtime(
         "Overtime request submitted..."
     """
     try:
-        ot_date = datetime.strptime(date, "%Y-%m-%d")
+        ot_date = parse_date(date)
     except ValueError:
         return "❌ **Error:** Invalid date format. Use YYYY-MM-DD"
 
     if hours <= 0 or hours > 12:
         return "❌ **Error:** Overtime hours must be between 0 and 12"
 
-    request_id = f"OT-{ot_date.strftime('%Y%m%d')}-{hash(reason) % 1000:03d}"
+    request_id = f"OT-{ot_date.strftime('%Y%m%d')}-{zlib.crc32(reason.encode()) % 1000:03d}"
 
     # Calculate pay
     hourly_rate = 80
     overtime_rate = hourly_rate * 1.5
     overtime_pay = hours * overtime_rate
 
-    result = f"""
-{"✅" if pre_approved else "⏳"} **Overtime Request {"Logged" if pre_approved else "Submitted"}**
-
-**Request ID:** {request_id}
-**Employee:** John Doe (EMP001)
-**Date:** {ot_date.strftime('%A, %B %d, %Y')}
-
-**Overtime Details:**
-   ⏰ Hours: {hours:.1f} hours
-   💰 Rate: ${overtime_rate:.2f}/hour (1.5x regular)
-   💵 Total Pay: ${overtime_pay:.2f}
-   🔖 Pre-approved: {"Yes" if pre_approved else "No"}
-
-**Reason:**
-   {reason}
-
-**Status:** {"Approved - Will be included in next payroll" if pre_approved else "Pending Manager Approval"}
-
-**Approval Process:**
-    """.strip()
-
-    if pre_approved:
-        result += """
-   ✅ Pre-approved by manager
-   ✅ Hours logged in timesheet
-   ✅ Forwarded to payroll
-   • Pay Date: Next pay period
-        """.strip()
-    else:
-        result += """
-   1. ⏳ Manager review (Jane Smith)
-   2. ⏳ HR verification
-   3. ⏳ Payroll processing
-   • Expected Response: 1-2 business days
-        """.strip()
-
-    result += f"""
-
-**Company Overtime Policy:**
-   • Overtime must be approved in advance (when possible)
-   • Rate: 1.5x regular hourly rate
-   • Maximum: 12 hours per day
-   • Weekend work: 2x rate (if applicable)
-   • Holiday work: 2.5x rate
-
-**This Pay Period:**
-   • Total Overtime: {hours + 2.5:.1f} hours
-   • Total OT Pay: ${(hours + 2.5) * overtime_rate:.2f}
-   • Regular Hours: 38.5 hours
-
-**Next Steps:**
-   {"• Hours will appear in next timesheet" if pre_approved else "• Wait for manager approval"}
-   • Track status with request ID
-   • Contact HR with questions
-
-💡 {"Thank you for your extra effort!" if pre_approved else "Reminder: Get pre-approval for planned overtime"}
-
-⏰ **Submitted:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    """.strip()
-
-    return result
+    return _OVERTIME_FORMAT.format(
+        **_OVERTIME_VARIANTS[bool(pre_approved)],
+        request_id=request_id,
+        ot_date=ot_date.strftime('%A, %B %d, %Y'),
+        hours=hours,
+        overtime_rate=overtime_rate,
+        overtime_pay=overtime_pay,
+        reason=reason,
+        period_hours=hours + 2.5,
+        period_pay=(hours + 2.5) * overtime_rate,
+        submitted=datetime.now().strftime(TIMESTAMP_FORMAT),
+    )
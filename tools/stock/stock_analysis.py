@@ -2,8 +2,40 @@
 
 from typing import Annotated
 from datetime import datetime
+from functools import lru_cache
 from tools._decorators import tool
 
+# Mock analyst coverage keyed by upper-case ticker
+_ANALYSIS_DATA = {
+    "AAPL": {
+        "name": "Apple Inc.",
+        "rating": "BUY",
+        "target_price": 185.00,
+        "analysts": 45,
+        "recommendation": "Strong Buy",
+        "sector": "Technology",
+        "market_cap": "2.8T"
+    },
+    "MSFT": {
+        "name": "Microsoft Corporation",
+        "rating": "HOLD",
+        "target_price": 385.00,
+        "analysts": 38,
+        "recommendation": "Hold",
+        "sector": "Technology",
+        "market_cap": "2.9T"
+    },
+    "OPENAI": {
+        "name": "OpenAI",
+        "rating": "BUY",
+        "target_price": 55.00,
+        "analysts": 12,
+        "recommendation": "Strong Buy",
+        "sector": "AI/Technology",
+        "market_cap": "90B"
+    }
+}
+
 
 @tool(
     domain="stock",
@@ -32,40 +64,25 @@ def get_stock_analysis(
         🎯 **Target Price:** $185.00
         ..."
     """
-    # Mock analysis data
-    analysis_data = {
-        "AAPL": {
-            "name": "Apple Inc.",
-            "rating": "BUY",
-            "target_price": 185.00,
-            "analysts": 45,
-            "recommendation": "Strong Buy",
-            "sector": "Technology",
-            "market_cap": "2.8T"
-        },
-        "MSFT": {
-            "name": "Microsoft Corporation",
-            "rating": "HOLD",
-            "target_price": 385.00,
-            "analysts": 38,
-            "recommendation": "Hold",
-            "sector": "Technology",
-            "market_cap": "2.9T"
-        },
-        "OPENAI": {
-            "name": "OpenAI",
-            "rating": "BUY",
-            "target_price": 55.00,
-            "analysts": 12,
-            "recommendation": "Strong Buy",
-            "sector": "AI/Technology",
-            "market_cap": "90B"
-        }
-    }
+    body = _analysis_body(symbol.upper())
+    if body is None:
+        return f"❌ Analysis not available for '{symbol}'. Available stocks: AAPL, MSFT, OPENAI"
+
+    return f"{body}\n📅 **Analysis Date:** {datetime.now().strftime('%Y-%m-%d')}"
+
 
-    symbol_upper = symbol.upper()
-    if symbol_upper in analysis_data:
-        data = analysis_data[symbol_upper]
+@lru_cache(maxsize=16)
+def _analysis_body(symbol_upper: str) -> str | None:
+    """Render the analysis for a symbol, minus the analysis date.
+
+    Args:
+        symbol_upper: Upper-cased stock ticker symbol
+
+    Returns:
+        Analysis text, or None if the symbol is not covered
+    """
+    if symbol_upper in _ANALYSIS_DATA:
+        data = _ANALYSIS_DATA[symbol_upper]
         rating_emoji = "🟢" if data["rating"] == "BUY" else "🟡" if data["rating"] == "HOLD" else "🔴"
 
         return f"""
@@ -75,7 +92,5 @@ def get_stock_analysis(
 👥 **Analysts:** {data['analysts']} covering
 🏢 **Sector:** {data['sector']}
 💼 **Market Cap:** ${data['market_cap']}
-📅 **Analysis Date:** {datetime.now().strftime('%Y-%m-%d')}
         """.strip()
-    else:
-        return f"❌ Analysis not available for '{symbol}'. Available stocks: AAPL, MSFT, OPENAI"
+    return None
@@ -5,6 +5,13 @@ from datetime import datetime, timedelta
 import random
 from tools._decorators import tool
 
+# Display names for the tickers with mock history
+_STOCK_NAMES = {
+    "AAPL": "Apple Inc.",
+    "MSFT": "Microsoft Corporation",
+    "OPENAI": "OpenAI",
+}
+
 
 @tool(
     domain="stock",
@@ -35,30 +42,23 @@ def get_stock_history(
         📅 2025-10-23: $175.12
         ..."
     """
-    # Mock historical data
-    stock_names = {
-        "AAPL": "Apple Inc.",
-        "MSFT": "Microsoft Corporation",
-        "OPENAI": "OpenAI"
-    }
-
     symbol_upper = symbol.upper()
-    if symbol_upper in stock_names:
+    if symbol_upper in _STOCK_NAMES:
         base_price = (
             random.uniform(150, 200) if symbol_upper == "AAPL"
             else random.uniform(350, 400) if symbol_upper == "MSFT"
             else random.uniform(40, 50)
         )
 
-        history = []
-        for i in range(days):
-            date = datetime.now() - timedelta(days=i)
-            price = base_price + random.uniform(-5, 5)
-            history.append(f"📅 {date.strftime('%Y-%m-%d')}: ${price:.2f}")
+        now = datetime.now()
+        history = "\n".join(
+            f"📅 {(now - timedelta(days=i)).strftime('%Y-%m-%d')}: ${base_price + random.uniform(-5, 5):.2f}"
+            for i in range(days)
+        )
 
         return f"""
-📊 **{stock_names[symbol_upper]} ({symbol_upper}) - {days} Day History**
-{chr(10).join(history)}
+📊 **{_STOCK_NAMES[symbol_upper]} ({symbol_upper}) - {days} Day History**
+{history}
 📈 **Trend:** {'Upward' if random.choice([True, False]) else 'Downward'}
         """.strip()
     else:
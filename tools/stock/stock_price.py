@@ -4,6 +4,20 @@ from typing import Annotated
 from datetime import datetime
 from tools._decorators import tool
 
+# Mock quotes keyed by upper-case ticker
+_STOCK_DATA = {
+    "AAPL": {"name": "Apple Inc.", "price": 175.43, "change": 2.15, "change_percent": 1.24},
+    "MSFT": {"name": "Microsoft Corporation", "price": 378.85, "change": -1.25, "change_percent": -0.33},
+    "OPENAI": {"name": "OpenAI", "price": 45.67, "change": 0.89, "change_percent": 1.99},
+}
+
+# Company names accepted in place of a ticker, keyed in lower case
+_SYMBOL_ALIASES = {
+    "apple": "AAPL",
+    "microsoft": "MSFT",
+    "openai": "OPENAI",
+}
+
 
 @tool(
     domain="stock",
@@ -32,19 +46,9 @@ def get_stock_price(
         📈 **Change:** $+2.15 (+1.24%)
         ..."
     """
-    # Mock stock data
-    stock_data = {
-        "AAPL": {"name": "Apple Inc.", "price": 175.43, "change": 2.15, "change_percent": 1.24},
-        "MSFT": {"name": "Microsoft Corporation", "price": 378.85, "change": -1.25, "change_percent": -0.33},
-        "OPENAI": {"name": "OpenAI", "price": 45.67, "change": 0.89, "change_percent": 1.99},
-        "apple": {"name": "Apple Inc.", "price": 175.43, "change": 2.15, "change_percent": 1.24},
-        "microsoft": {"name": "Microsoft Corporation", "price": 378.85, "change": -1.25, "change_percent": -0.33},
-        "openai": {"name": "OpenAI", "price": 45.67, "change": 0.89, "change_percent": 1.99}
-    }
-
-    symbol_upper = symbol.upper()
-    if symbol_upper in stock_data:
-        data = stock_data[symbol_upper]
+    symbol_upper = _SYMBOL_ALIASES.get(symbol.lower(), symbol.upper())
+    if symbol_upper in _STOCK_DATA:
+        data = _STOCK_DATA[symbol_upper]
         change_symbol = "📈" if data["change"] >= 0 else "📉"
         return f"""
 📊 **{data['name']} ({symbol_upper})**
@@ -0,0 +1,4 @@
+"""Shared mock data for weather tools."""
+
+# Weather conditions cycled through by the mock current/forecast tools
+CONDITIONS = ("sunny", "cloudy", "rainy", "stormy")
@@ -2,6 +2,7 @@
 
 from typing import Annotated
 from tools._decorators import tool
+from ._conditions import CONDITIONS
 
 
 @tool(
@@ -28,6 +29,5 @@ def get_weather(
         >>> get_weather("London")
         "The weather in London is sunny with a high of 22°C."
     """
-    conditions = ["sunny", "cloudy", "rainy", "stormy"]
     temperature = 22
-    return f"The weather in {location} is {conditions[0]} with a high of {temperature}°C."
+    return f"The weather in {location} is {CONDITIONS[0]} with a high of {temperature}°C."
@@ -2,6 +2,7 @@
 
 from typing import Annotated
 from tools._decorators import tool
+from ._conditions import CONDITIONS
 
 
 @tool(
@@ -33,12 +34,9 @@ def get_forecast(
         Day 2: rainy, 20°C
         ..."
     """
-    conditions = ["sunny", "cloudy", "rainy", "stormy"]
-    forecast: list[str] = []
+    forecast = "\n".join(
+        f"Day {day}: {CONDITIONS[day % len(CONDITIONS)]}, {18 + day}°C"
+        for day in range(1, days + 1)
+    )
 
-    for day in range(1, days + 1):
-        condition = conditions[day % len(conditions)]
-        temp = 18 + day
-        forecast.append(f"Day {day}: {condition}, {temp}°C")
-
-    return f"Weather forecast for {location}:\n" + "\n".join(forecast)
+    return f"Weather forecast for {location}:\n{forecast}"
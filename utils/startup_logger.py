@@ -3,12 +3,40 @@
 This module provides enhanced, colorful, and organized logging for system startup.
 """
 
+import heapq
+import io
 import logging
+import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
 from typing import Dict, List, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Domain keyword -> icon, in priority order when matched inside an agent ID
+_DOMAIN_ICONS = {
+    "calendar": "📅",
+    "email": "📧",
+    "stock": "📈",
+    "weather": "🌤️",
+}
+
+@lru_cache(maxsize=256)
+def _agent_icon(agent_id: str) -> str:
+    """Pick an agent's icon from the domain keywords in its ID.
+
+    The earliest keyword in _DOMAIN_ICONS wins when the ID contains several.
+    """
+    agent_id = agent_id.lower()
+    return next((icon for keyword, icon in _DOMAIN_ICONS.items() if keyword in agent_id), "🤖")
+
+
+@lru_cache(maxsize=16)
+def _provider_name(client_class: type) -> str:
+    """Name the model provider behind a chat client class."""
+    return "OpenRouter" if "openrouter" in str(client_class).lower() else "Azure"
+
 
 class StartupLogger:
     """Enhanced logger for beautiful startup output."""
@@ -43,6 +71,14 @@ class StartupLogger:
     SPARKLES = "✨"
     PACKAGE = "📦"
 
+    # Pre-colored fragments repeated throughout the banner
+    BULLET = f"{GRAY}•{RESET}"
+    SEPARATOR = f"{GRAY}{'─' * 80}{RESET}"
+    RULE = "=" * 80
+
+    # Agent → tool mapping row: domain label, first tools, overflow note
+    TOOL_MAPPING_LINE = f"      {BLUE}{{domain}}:{RESET} {WHITE}{{tools}}{RESET}{{more}}"
+
     @staticmethod
     def _colorize(text: str, color: str, bold: bool = False) -> str:
         """Add color to text."""
@@ -53,19 +89,19 @@ class StartupLogger:
     def print_header():
         """Print beautiful startup header."""
         width = 80
-        print("\n" + "=" * width)
+        print("\n" + StartupLogger.RULE)
         title = f"{StartupLogger.ROCKET}  Multi-Agent System Startup"
         print(StartupLogger._colorize(title.center(width), StartupLogger.BLUE, bold=True))
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(StartupLogger._colorize(timestamp.center(width), StartupLogger.GRAY))
-        print("=" * width + "\n")
+        print(StartupLogger.RULE + "\n")
 
     @staticmethod
     def print_section(title: str, emoji: str = ""):
         """Print a section header."""
         full_title = f"{emoji} {title}" if emoji else title
         print(StartupLogger._colorize(full_title, StartupLogger.CYAN, bold=True))
-        print(StartupLogger._colorize("─" * 80, StartupLogger.GRAY))
+        print(StartupLogger.SEPARATOR)
 
     @staticmethod
     def print_tool_discovery(tools_by_domain: Dict[str, List[str]]):
@@ -75,25 +111,16 @@ class StartupLogger:
         total_tools = sum(len(tools) for tools in tools_by_domain.values())
         print(f"\n{StartupLogger.PACKAGE} Discovered {StartupLogger._colorize(str(total_tools), StartupLogger.GREEN, bold=True)} tools across {StartupLogger._colorize(str(len(tools_by_domain)), StartupLogger.GREEN, bold=True)} domains\n")
 
-        # Domain icons
-        domain_icons = {
-            "calendar": "📅",
-            "email": "📧",
-            "stock": "📈",
-            "weather": "🌤️",
-        }
-
         for domain, tools in sorted(tools_by_domain.items()):
-            icon = domain_icons.get(domain, "🔧")
+            icon = _DOMAIN_ICONS.get(domain, "🔧")
             domain_name = StartupLogger._colorize(domain.title(), StartupLogger.BLUE, bold=True)
             count = StartupLogger._colorize(f"({len(tools)} tools)", StartupLogger.GREEN)
             print(f"  {icon}  {domain_name} {count}")
 
             # Show first 3 tools, then "and X more..."
-            for i, tool in enumerate(sorted(tools)):
-                if i < 3:
-                    tool_name = tool.split('.')[-1] if '.' in tool else tool
-                    print(f"     {StartupLogger._colorize('•', StartupLogger.GRAY)} {tool_name}")
+            for tool in heapq.nsmallest(3, tools):
+                tool_name = tool.split('.')[-1] if '.' in tool else tool
+                print(f"     {StartupLogger.BULLET} {tool_name}")
 
             if len(tools) > 3:
                 more = len(tools) - 3
@@ -107,21 +134,8 @@ class StartupLogger:
 
         print(f"\n{StartupLogger.SPARKLES} Discovered {StartupLogger._colorize(str(len(agents)), StartupLogger.GREEN, bold=True)} agents\n")
 
-        # Agent icons
-        agent_icons = {
-            "calendar": "📅",
-            "email": "📧",
-            "stock": "📈",
-            "weather": "🌤️",
-        }
-
         for agent_id, agent in agents.items():
-            # Determine icon
-            icon = "🤖"
-            for keyword, emoji in agent_icons.items():
-                if keyword in agent_id.lower():
-                    icon = emoji
-                    break
+            icon = _agent_icon(agent_id)
 
             # Agent name
             agent_name = StartupLogger._colorize(agent.name, StartupLogger.BLUE, bold=True)
@@ -137,7 +151,7 @@ class StartupLogger:
 
             # Show agent's model provider
             if hasattr(agent, 'chat_client'):
-                model_info = "OpenRouter" if "openrouter" in str(type(agent.chat_client)).lower() else "Azure"
+                model_info = _provider_name(type(agent.chat_client))
                 provider_text = StartupLogger._colorize(f"Provider: {model_info}", StartupLogger.GRAY)
                 print(f"      {provider_text}")
 
@@ -150,17 +164,7 @@ class StartupLogger:
 
         print()
         for agent_id, agent in agents.items():
-            # Determine icon
-            icon = "🤖"
-            if "calendar" in agent_id.lower():
-                icon = "📅"
-            elif "email" in agent_id.lower():
-                icon = "📧"
-            elif "stock" in agent_id.lower():
-                icon = "📈"
-            elif "weather" in agent_id.lower():
-                icon = "🌤️"
-
+            icon = _agent_icon(agent_id)
             agent_name = StartupLogger._colorize(agent.name, StartupLogger.CYAN, bold=True)
             print(f"  {icon}  {agent_name}")
 
@@ -171,12 +175,11 @@ class StartupLogger:
                 # Group tools by domain
                 tools_by_domain = {}
                 for tool in agent_tools:
-                    tool_name = tool.__name__ if hasattr(tool, '__name__') else str(tool)
+                    tool_name = getattr(tool, '__name__', None) or str(tool)
 
                     # Extract domain from tool metadata
-                    domain = "general"
-                    if hasattr(tool, '_tool_metadata'):
-                        domain = tool._tool_metadata.get('domain', 'general')
+                    metadata = getattr(tool, '_tool_metadata', None)
+                    domain = metadata.get('domain', 'general') if metadata else "general"
 
                     if domain not in tools_by_domain:
                         tools_by_domain[domain] = []
@@ -184,11 +187,8 @@ class StartupLogger:
 
                 # Print tools by domain
                 for domain, tools in sorted(tools_by_domain.items()):
-                    domain_text = StartupLogger._colorize(f"{domain}:", StartupLogger.BLUE)
-                    tools_text = StartupLogger._colorize(f"{', '.join(tools[:3])}", StartupLogger.WHITE)
-                    if len(tools) > 3:
-                        tools_text += StartupLogger._colorize(f" (+{len(tools)-3} more)", StartupLogger.GRAY)
-                    print(f"      {domain_text} {tools_text}")
+                    more = f"{StartupLogger.GRAY} (+{len(tools) - 3} more){StartupLogger.RESET}" if len(tools) > 3 else ""
+                    print(StartupLogger.TOOL_MAPPING_LINE.format(domain=domain, tools=", ".join(tools[:3]), more=more))
             else:
                 print(f"      {StartupLogger._colorize('No tools', StartupLogger.GRAY)}")
 
@@ -209,7 +209,7 @@ class StartupLogger:
     @staticmethod
     def print_footer(url: str = "http://localhost:8080", agent_count: int = 0):
         """Print startup footer with URL."""
-        print("=" * 80)
+        print(StartupLogger.RULE)
 
         # Status
         status = StartupLogger._colorize("✓ READY", StartupLogger.GREEN, bold=True)
@@ -226,17 +226,26 @@ class StartupLogger:
         # Tips
         print(f"\n  {StartupLogger.SPARKLES}  {StartupLogger._colorize('Tip:', StartupLogger.GRAY)} Drop a YAML file in agents/ to add a new agent!")
 
-        print("\n" + "=" * 80 + "\n")
+        print(f"\n{StartupLogger.RULE}\n")
 
     @staticmethod
     def print_startup_summary(tools_by_domain: Dict[str, List[str]], agents: Dict[str, Any], agent_tools_map: Dict[str, List[Any]] = None, warnings: List[str] = None):
-        """Print complete startup summary."""
-        StartupLogger.print_header()
-        StartupLogger.print_tool_discovery(tools_by_domain)
-        StartupLogger.print_agent_discovery(agents, tools_by_domain, agent_tools_map)
-        StartupLogger.print_agent_tool_mapping(agents, agent_tools_map)
+        """Print complete startup summary.
+
+        The sections are rendered into a buffer and written to stdout in one
+        go, rather than line by line as each section prints.
+        """
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            StartupLogger.print_header()
+            StartupLogger.print_tool_discovery(tools_by_domain)
+            StartupLogger.print_agent_discovery(agents, tools_by_domain, agent_tools_map)
+            StartupLogger.print_agent_tool_mapping(agents, agent_tools_map)
+
+            if warnings:
+                StartupLogger.print_warnings(warnings)
 
-        if warnings:
-            StartupLogger.print_warnings(warnings)
+            StartupLogger.print_footer(agent_count=len(agents))
 
-        StartupLogger.print_footer(agent_count=len(agents))
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
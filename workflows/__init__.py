@@ -10,27 +10,12 @@ The comprehensive_workflow module demonstrates 6 different workflow patterns:
 4. Parallel + Synthesis
 5. Comprehensive Business Workflow
 6. Multi-Domain Parallel
+
+Names are resolved lazily, so importing the package alone does not build
+the workflows or their Azure chat clients.
 """
 
-from .comprehensive_workflow import (
-    # Workflows
-    sequential_workflow,
-    parallel_workflow,
-    enhanced_sequential,
-    parallel_with_synthesis_workflow,
-    comprehensive_business_workflow,
-    multi_domain_parallel,
-    # Agents
-    market_analyzer,
-    investment_advisor,
-    synthesis_agent,
-    # Examples
-    example_sequential,
-    example_parallel,
-    example_synthesis,
-    example_comprehensive,
-    example_streaming,
-)
+from importlib import import_module
 
 __all__ = [
     # Workflows
@@ -51,3 +36,10 @@ __all__ = [
     "example_comprehensive",
     "example_streaming",
 ]
+
+
+def __getattr__(name: str):
+    """Import comprehensive_workflow on first access to one of its exports."""
+    if name in __all__:
+        return getattr(import_module(".comprehensive_workflow", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
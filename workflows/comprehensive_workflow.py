@@ -10,17 +10,14 @@ This file demonstrates various workflow patterns including:
 All workflows use the dynamically discovered agents from agents/ directory.
 """
 
-from typing import Annotated
-from datetime import datetime, timedelta
 import random
+from itertools import permutations
 
 from agent_framework import (
     ChatAgent,
     WorkflowBuilder,
     WorkflowViz,
     ConcurrentBuilder,
-    WorkflowExecutor,
-    WorkflowContext
 )
 from agent_framework.azure import AzureOpenAIChatClient
 from azure.identity import AzureCliCredential
@@ -39,55 +36,78 @@ from agents import (
 # HELPER FUNCTIONS FOR WORKFLOWS
 # ============================================================================
 
+# Market conditions the mock analysis picks from
+_MARKET_CONDITIONS = ("bullish", "bearish", "volatile", "stable")
+
+# Sector -> (low, high) bounds for the mock daily change in percent
+_SECTOR_RANGES = {
+    "Technology": (-2, 5),
+    "Healthcare": (-1, 3),
+    "Energy": (-3, 4),
+    "Finance": (-2, 2),
+}
+
+# Every ordered pair of mock recommendations, rendered once at import
+_RECOMMENDATION_REPORTS = tuple(
+    f"Investment Recommendations:\n  • {first}\n  • {second}"
+    for first, second in permutations((
+        "Consider diversifying into technology and healthcare sectors",
+        "Reduce exposure to energy sector due to volatility",
+        "Focus on blue-chip stocks with strong fundamentals",
+        "Monitor market conditions closely for entry opportunities",
+    ), 2)
+)
+
+
 def analyze_market_conditions() -> str:
     """Analyze current market conditions."""
-    conditions = ["bullish", "bearish", "volatile", "stable"]
-    condition = random.choice(conditions)
+    condition = random.choice(_MARKET_CONDITIONS)
     return f"Market Analysis: Current market conditions are {condition} with moderate volatility."
 
 
 def get_sector_performance() -> str:
     """Get sector performance data."""
-    sectors = {
-        "Technology": random.uniform(-2, 5),
-        "Healthcare": random.uniform(-1, 3),
-        "Energy": random.uniform(-3, 4),
-        "Finance": random.uniform(-2, 2)
-    }
-
-    result = "Sector Performance:\n"
-    for sector, change in sectors.items():
-        emoji = "+" if change > 0 else ""
-        result += f"  • {sector}: {emoji}{change:.2f}%\n"
-
-    return result
+    changes = {sector: random.uniform(low, high) for sector, (low, high) in _SECTOR_RANGES.items()}
+    rows = "".join(
+        f"  • {sector}: {'+' if change > 0 else ''}{change:.2f}%\n"
+        for sector, change in changes.items()
+    )
+    return f"Sector Performance:\n{rows}"
 
 
 def generate_investment_recommendation() -> str:
     """Generate investment recommendations based on analysis."""
-    recommendations = [
-        "Consider diversifying into technology and healthcare sectors",
-        "Reduce exposure to energy sector due to volatility",
-        "Focus on blue-chip stocks with strong fundamentals",
-        "Monitor market conditions closely for entry opportunities"
-    ]
-
-    return "Investment Recommendations:\n" + "\n".join(f"  • {r}" for r in random.sample(recommendations, 2))
+    return random.choice(_RECOMMENDATION_REPORTS)
 
 
 # ============================================================================
 # SPECIALIZED ANALYSIS AGENTS
 # ============================================================================
 
+# One chat client shared by every analysis agent below
+_CHAT_CLIENT = AzureOpenAIChatClient(
+    endpoint="https://azure-openai-aueast.openai.azure.com/",
+    deployment_name="gpt-4o-moretpm",
+    credential=AzureCliCredential(),
+)
+
+# Synthesis system prompt, kept flush-left so no indentation is sent with each call
+_SYNTHESIS_INSTRUCTIONS = """\
+You receive information from multiple specialized agents.
+Your job is to:
+1. Combine insights from all sources
+2. Identify correlations and patterns
+3. Provide clear, actionable recommendations
+4. Prioritize the most important findings
+
+Be specific and reference all the data sources in your synthesis.
+Format your output with clear sections and bullet points."""
+
 market_analyzer = ChatAgent(
     name="Market Analyzer",
     description="Analyzes market conditions and trends",
     instructions="You are a financial market analyst. Analyze market conditions and provide insights.",
-    chat_client=AzureOpenAIChatClient(
-        endpoint="https://azure-openai-aueast.openai.azure.com/",
-        deployment_name="gpt-4o-moretpm",
-        credential=AzureCliCredential(),
-    ),
+    chat_client=_CHAT_CLIENT,
     tools=[analyze_market_conditions, get_sector_performance]
 )
 
@@ -95,33 +115,15 @@ investment_advisor = ChatAgent(
     name="Investment Advisor",
     description="Provides investment recommendations",
     instructions="You are an investment advisor. Provide strategic investment recommendations based on market analysis.",
-    chat_client=AzureOpenAIChatClient(
-        endpoint="https://azure-openai-aueast.openai.azure.com/",
-        deployment_name="gpt-4o-moretpm",
-        credential=AzureCliCredential(),
-    ),
+    chat_client=_CHAT_CLIENT,
     tools=[generate_investment_recommendation]
 )
 
 synthesis_agent = ChatAgent(
     name="Synthesis Agent",
     description="Synthesizes information from multiple sources into actionable insights",
-    instructions="""
-    You receive information from multiple specialized agents.
-    Your job is to:
-    1. Combine insights from all sources
-    2. Identify correlations and patterns
-    3. Provide clear, actionable recommendations
-    4. Prioritize the most important findings
-
-    Be specific and reference all the data sources in your synthesis.
-    Format your output with clear sections and bullet points.
-    """,
-    chat_client=AzureOpenAIChatClient(
-        endpoint="https://azure-openai-aueast.openai.azure.com/",
-        deployment_name="gpt-4o-moretpm",
-        credential=AzureCliCredential(),
-    ),
+    instructions=_SYNTHESIS_INSTRUCTIONS,
+    chat_client=_CHAT_CLIENT,
 )
 
 
@@ -151,16 +153,12 @@ sequential_workflow = (
 
 def combine_parallel_results(results):
     """Custom aggregator to combine results from parallel execution."""
-    combined = ["=== Parallel Analysis Results ===\n"]
-
-    for i, result in enumerate(results, 1):
-        if result.agent_run_response.messages:
-            agent_name = result.executor_id
-            last_message = result.agent_run_response.messages[-1].text
-            combined.append(f"\n--- Analysis {i}: {agent_name} ---")
-            combined.append(last_message)
-
-    return "\n".join(combined)
+    sections = "".join(
+        f"\n\n--- Analysis {i}: {result.executor_id} ---\n{messages[-1].text}"
+        for i, result in enumerate(results, 1)
+        if (messages := result.agent_run_response.messages)
+    )
+    return f"=== Parallel Analysis Results ===\n{sections}"
 
 
 parallel_workflow = (
@@ -198,17 +196,21 @@ enhanced_sequential = (
 # Use case: Multiple parallel analyses combined into single report
 # Example: Stock AND Weather AND Market → Synthesis
 
-# Note: ConcurrentBuilder with ChatAgent aggregator requires special handling
-# We'll use a sequential approach: parallel agents → synthesis
+async def synthesize_parallel_results(results):
+    """Aggregator that hands the combined parallel results to synthesis_agent."""
+    response = await synthesis_agent.run(combine_parallel_results(results))
+    return response.text
+
+
+# The analyses fan out concurrently and only the synthesis waits on all of them
 parallel_with_synthesis_workflow = (
-    WorkflowBuilder(
-        name="Parallel Analysis with Synthesis",
-        description="[Stock || Weather || Market] → Synthesis (Parallel → AI synthesis)"
-    )
-    .set_start_executor(market_analyzer)
-    .add_edge(market_analyzer, synthesis_agent)
+    ConcurrentBuilder()
+    .participants([stock_agent, weather_agent, market_analyzer])
+    .with_aggregator(synthesize_parallel_results)
     .build()
 )
+parallel_with_synthesis_workflow.name = "Parallel Analysis with Synthesis"
+parallel_with_synthesis_workflow.description = "[Stock || Weather || Market] → Synthesis (Parallel → AI synthesis)"
 
 
 # ============================================================================
@@ -399,6 +401,7 @@ __all__ = [
 
     # Utility functions
     "combine_parallel_results",
+    "synthesize_parallel_results",
     "analyze_market_conditions",
     "get_sector_performance",
     "generate_investment_recommendation",